@@ -4,52 +4,78 @@
 Exemplo rápido de uso do MCP Server
 """
 
+import logging
+import sys
 from pathlib import Path
 
 from ai_research_assistant import AIResearchAssistant, ResearchArea
 
 
+class BufferedOutput:
+    """Acumula linhas e as escreve no stdout numa única chamada por seção"""
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def p(self, text: str = "") -> None:
+        self.lines.append(text)
+
+    def flush(self) -> None:
+        if self.lines:
+            sys.stdout.write("\n".join(self.lines) + "\n")
+            self.lines.clear()
+
+
 def main():
     """Exemplo de uso básico"""
 
-    print("🤖 MCP Server - Quick Start Example\n")
+    out = BufferedOutput()
+
+    out.p("🤖 MCP Server - Quick Start Example\n")
 
     # 1. Analisar projeto atual
     project_path = Path.cwd()
-    print(f"📂 Analisando: {project_path}\n")
+    out.p(f"📂 Analisando: {project_path}\n")
+    out.flush()
 
-    assistant = AIResearchAssistant(project_path)
+    assistant = AIResearchAssistant(project_path, verbose=True)
 
     # 2. Executar análise
     analysis = assistant.analyze_project()
 
-    print("\n✅ Análise concluída!")
-    print(f"   📁 Arquivos: {analysis.files_analyzed}")
-    print(f"   🔧 Tecnologias: {', '.join(analysis.technologies)}")
+    out.p("\n✅ Análise concluída!")
+    out.p(f"   📁 Arquivos: {analysis.files_analyzed}")
+    out.p(f"   🔧 Tecnologias: {', '.join(analysis.technologies)}")
 
     # 3. Buscar papers relevantes
-    print("\n📚 Buscando papers sobre Machine Learning...\n")
+    out.p("\n📚 Buscando papers sobre Machine Learning...\n")
+    out.flush()
     papers = assistant.search_relevant_research(ResearchArea.MACHINE_LEARNING, max_papers=3)
 
     for i, paper in enumerate(papers, 1):
-        print(f"   {i}. {paper.title}")
-        print(f"      Keywords: {', '.join(paper.keywords[:3])}")
+        out.p(f"   {i}. {paper.title}")
+        out.p(f"      Keywords: {', '.join(paper.keywords[:3])}")
 
     # 4. Gerar sugestões
-    print("\n💡 Gerando sugestões...\n")
+    out.p("\n💡 Gerando sugestões...\n")
+    out.flush()
     suggestions = assistant.suggest_improvements()
 
     for i, suggestion in enumerate(suggestions[:5], 1):
-        print(f"   {i}. {suggestion}")
+        out.p(f"   {i}. {suggestion}")
 
     # 5. Salvar relatório
-    print("\n📄 Gerando relatório completo...\n")
+    out.p("\n📄 Gerando relatório completo...\n")
+    out.flush()
     report_path = project_path / "mcp_quick_report.txt"
     assistant.generate_report(report_path)
 
-    print("\n✅ Exemplo concluído!")
-    print(f"   Relatório salvo em: {report_path}")
+    out.p("\n✅ Exemplo concluído!")
+    out.p(f"   Relatório salvo em: {report_path}")
+    out.flush()
 
 
 if __name__ == "__main__":
+    # Exibe o progresso da análise (logging do pacote) junto com a saída da demo
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     main()
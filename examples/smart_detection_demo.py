@@ -4,15 +4,37 @@
 Demonstra como o sistema agora detecta tecnologias de múltiplas fontes
 """
 
+import logging
+import sys
 from pathlib import Path
 
 from ai_research_assistant import AIResearchAssistant, ProjectMetadataExtractor
 
+# Marcadores (em minúsculas) de sugestões relacionadas ao MCP
+MCP_MARKERS = frozenset({"mcp", "model context protocol"})
+
+
+class BufferedOutput:
+    """Acumula linhas e as escreve no stdout numa única chamada por seção"""
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def p(self, text: str = "") -> None:
+        self.lines.append(text)
+
+    def flush(self) -> None:
+        if self.lines:
+            sys.stdout.write("\n".join(self.lines) + "\n")
+            self.lines.clear()
+
 
 def demo_metadata_extraction():
     """Demo de extração de metadados"""
 
-    print("""
+    out = BufferedOutput()
+
+    out.p("""
     ╔════════════════════════════════════════════════════════════╗
     ║   🎯 DEMO: Detecção Inteligente de Tecnologias            ║
     ╚════════════════════════════════════════════════════════════╝
@@ -21,124 +43,136 @@ def demo_metadata_extraction():
     # Usar o próprio projeto ai-research-assistant como exemplo
     project_path = Path(__file__).parent.parent
 
-    print(f"📂 Projeto: {project_path.name}\n")
+    out.p(f"📂 Projeto: {project_path.name}\n")
 
     # 1. Extrair metadados manualmente
-    print("=" * 60)
-    print("1️⃣  EXTRAÇÃO DE METADADOS")
-    print("=" * 60)
+    out.p("=" * 60)
+    out.p("1️⃣  EXTRAÇÃO DE METADADOS")
+    out.p("=" * 60)
+    out.flush()
 
     extractor = ProjectMetadataExtractor()
     metadata = extractor.extract_from_pyproject(project_path)
 
     if metadata:
-        print("\n✅ pyproject.toml encontrado!")
-        print(f"   Nome: {metadata.name}")
-        print(f"   Versão: {metadata.version}")
-        print(f"   Descrição: {metadata.description}")
-        print("\n   📌 Keywords detectadas:")
+        out.p("\n✅ pyproject.toml encontrado!")
+        out.p(f"   Nome: {metadata.name}")
+        out.p(f"   Versão: {metadata.version}")
+        out.p(f"   Descrição: {metadata.description}")
+        out.p("\n   📌 Keywords detectadas:")
         for keyword in metadata.keywords:
-            print(f"      • {keyword}")
+            out.p(f"      • {keyword}")
 
-        print(f"\n   📦 Dependências ({len(metadata.dependencies)}):")
+        out.p(f"\n   📦 Dependências ({len(metadata.dependencies)}):")
         for dep in metadata.dependencies[:5]:
-            print(f"      • {dep}")
+            out.p(f"      • {dep}")
         if len(metadata.dependencies) > 5:
-            print(f"      ... e mais {len(metadata.dependencies) - 5}")
+            out.p(f"      ... e mais {len(metadata.dependencies) - 5}")
+    out.flush()
 
     # 2. Análise completa do projeto
-    print("\n\n" + "=" * 60)
-    print("2️⃣  ANÁLISE COMPLETA DO PROJETO")
-    print("=" * 60 + "\n")
+    out.p("\n\n" + "=" * 60)
+    out.p("2️⃣  ANÁLISE COMPLETA DO PROJETO")
+    out.p("=" * 60 + "\n")
+    out.flush()
 
-    assistant = AIResearchAssistant(project_path)
+    assistant = AIResearchAssistant(project_path, verbose=True)
     analysis = assistant.analyze_project()
 
-    print("\n✅ Análise concluída!")
-    print(f"\n   📁 Arquivos Python: {analysis.files_analyzed}")
-    print("\n   🔧 Tecnologias detectadas:")
+    out.p("\n✅ Análise concluída!")
+    out.p(f"\n   📁 Arquivos Python: {analysis.files_analyzed}")
+    out.p("\n   🔧 Tecnologias detectadas:")
     for tech in analysis.technologies:
-        print(f"      ✓ {tech}")
+        out.p(f"      ✓ {tech}")
+    out.flush()
 
     # 3. Busca automática de papers
-    print("\n\n" + "=" * 60)
-    print("3️⃣  BUSCA AUTOMÁTICA DE PAPERS")
-    print("=" * 60)
+    out.p("\n\n" + "=" * 60)
+    out.p("3️⃣  BUSCA AUTOMÁTICA DE PAPERS")
+    out.p("=" * 60)
 
-    print("\n   💡 Sistema detecta keywords e busca automaticamente!\n")
+    out.p("\n   💡 Sistema detecta keywords e busca automaticamente!\n")
+    out.flush()
 
     # Busca usando keywords automaticamente
     papers = assistant.search_relevant_research()
 
-    print(f"   📚 Papers encontrados ({len(papers)}):\n")
+    out.p(f"   📚 Papers encontrados ({len(papers)}):\n")
     for i, paper in enumerate(papers, 1):
-        print(f"   {i}. {paper.title}")
-        print(f"      Keywords: {', '.join(paper.keywords[:3])}")
-        print(f"      URL: {paper.url}\n")
+        out.p(f"   {i}. {paper.title}")
+        out.p(f"      Keywords: {', '.join(paper.keywords[:3])}")
+        out.p(f"      URL: {paper.url}\n")
+    out.flush()
 
     # 4. Sugestões específicas
-    print("=" * 60)
-    print("4️⃣  SUGESTÕES ESPECÍFICAS")
-    print("=" * 60 + "\n")
+    out.p("=" * 60)
+    out.p("4️⃣  SUGESTÕES ESPECÍFICAS")
+    out.p("=" * 60 + "\n")
 
     suggestions = assistant.suggest_improvements()
 
     # Filtrar sugestões sobre MCP
-    mcp_suggestions = [s for s in suggestions if "MCP" in s or "Model Context Protocol" in s]
+    mcp_suggestions = [s for s in suggestions if any(marker in s.lower() for marker in MCP_MARKERS)]
 
-    print("   🔌 Sugestões relacionadas ao MCP:\n")
+    out.p("   🔌 Sugestões relacionadas ao MCP:\n")
     for suggestion in mcp_suggestions:
-        print(f"      • {suggestion}\n")
+        out.p(f"      • {suggestion}\n")
+    out.flush()
 
     # 5. Comparação: Antes vs Depois
-    print("=" * 60)
-    print("5️⃣  ANTES vs DEPOIS")
-    print("=" * 60 + "\n")
-
-    print("   ❌ ANTES (Hard-coded):")
-    print("      • Lista fixa de tecnologias")
-    print("      • Não detectava 'mcp' do pyproject.toml")
-    print("      • Papers genéricos\n")
-
-    print("   ✅ DEPOIS (Inteligente):")
-    print("      • Lê pyproject.toml, setup.py, requirements.txt")
-    print("      • Detecta keywords: 'mcp' → Model Context Protocol")
-    print("      • Detecta dependencies automaticamente")
-    print("      • Busca papers específicos sobre MCP")
-    print("      • Sugestões contextualizadas\n")
+    out.p("=" * 60)
+    out.p("5️⃣  ANTES vs DEPOIS")
+    out.p("=" * 60 + "\n")
+
+    out.p("   ❌ ANTES (Hard-coded):")
+    out.p("      • Lista fixa de tecnologias")
+    out.p("      • Não detectava 'mcp' do pyproject.toml")
+    out.p("      • Papers genéricos\n")
+
+    out.p("   ✅ DEPOIS (Inteligente):")
+    out.p("      • Lê pyproject.toml, setup.py, requirements.txt")
+    out.p("      • Detecta keywords: 'mcp' → Model Context Protocol")
+    out.p("      • Detecta dependencies automaticamente")
+    out.p("      • Busca papers específicos sobre MCP")
+    out.p("      • Sugestões contextualizadas\n")
+    out.flush()
 
     # 6. Relatório final
-    print("=" * 60)
-    print("6️⃣  RELATÓRIO COMPLETO")
-    print("=" * 60 + "\n")
+    out.p("=" * 60)
+    out.p("6️⃣  RELATÓRIO COMPLETO")
+    out.p("=" * 60 + "\n")
+    out.flush()
 
     report = assistant.generate_report()
-    print(report)
+    out.p(report)
+    out.flush()
 
 
 def demo_multi_source_detection():
     """Demo de detecção de múltiplas fontes"""
 
-    print("\n\n")
-    print("╔════════════════════════════════════════════════════════════╗")
-    print("║   🎯 DEMO: Detecção Multi-Fonte                           ║")
-    print("╚════════════════════════════════════════════════════════════╝\n")
+    out = BufferedOutput()
+    out.p("\n\n")
+    out.p("╔════════════════════════════════════════════════════════════╗")
+    out.p("║   🎯 DEMO: Detecção Multi-Fonte                           ║")
+    out.p("╚════════════════════════════════════════════════════════════╝\n")
 
-    print("O sistema agora detecta tecnologias de 3 fontes:\n")
+    out.p("O sistema agora detecta tecnologias de 3 fontes:\n")
 
-    print("1️⃣  Keywords do pyproject.toml")
-    print("   Exemplo: 'mcp' → Model Context Protocol")
-    print("   Benefício: Detecta intenção do projeto\n")
+    out.p("1️⃣  Keywords do pyproject.toml")
+    out.p("   Exemplo: 'mcp' → Model Context Protocol")
+    out.p("   Benefício: Detecta intenção do projeto\n")
 
-    print("2️⃣  Dependencies listadas")
-    print("   Exemplo: 'numpy>=1.26' → NumPy")
-    print("   Benefício: Sabe exatamente o que está instalado\n")
+    out.p("2️⃣  Dependencies listadas")
+    out.p("   Exemplo: 'numpy>=1.26' → NumPy")
+    out.p("   Benefício: Sabe exatamente o que está instalado\n")
 
-    print("3️⃣  Imports no código")
-    print("   Exemplo: 'import pandas' → Pandas")
-    print("   Benefício: Detecta uso real no código\n")
+    out.p("3️⃣  Imports no código")
+    out.p("   Exemplo: 'import pandas' → Pandas")
+    out.p("   Benefício: Detecta uso real no código\n")
 
-    print("✨ Resultado: Detecção completa e precisa!\n")
+    out.p("✨ Resultado: Detecção completa e precisa!\n")
+    out.flush()
 
 
 def main():
@@ -148,11 +182,12 @@ def main():
         demo_metadata_extraction()
         demo_multi_source_detection()
 
-        print("\n" + "=" * 60)
-        print("✅ DEMO CONCLUÍDA COM SUCESSO!")
-        print("=" * 60)
+        out = BufferedOutput()
+        out.p("\n" + "=" * 60)
+        out.p("✅ DEMO CONCLUÍDA COM SUCESSO!")
+        out.p("=" * 60)
 
-        print("""
+        out.p("""
     🎯 Agora você pode:
 
     1. Executar no seu projeto:
@@ -167,6 +202,7 @@ def main():
        assistant = AIResearchAssistant("/path")
        assistant.analyze_project()
         """)
+        out.flush()
 
     except Exception as e:
         print(f"\n❌ Erro: {e}")
@@ -176,4 +212,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Exibe o progresso da análise (logging do pacote) junto com a saída da demo
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     main()
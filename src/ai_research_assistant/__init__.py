@@ -16,20 +16,58 @@ Features:
 __version__ = "0.5.0"
 __author__ = "João"
 
-from ai_research_assistant.ai_research_assistant import (
-    AIResearchAssistant,
-    Model,
-    Paper,
-    ProjectAnalysis,
-    ProjectMetadata,
-    ProjectMetadataExtractor,
-    ResearchArea,
-)
-from ai_research_assistant.readme_parser import (
-    ReadmeParser,
-    ResearchMetadata,
-    create_research_readme_template,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ai_research_assistant.ai_research_assistant import (
+        AIResearchAssistant,
+        Model,
+        Paper,
+        ProjectAnalysis,
+        ProjectMetadata,
+        ProjectMetadataExtractor,
+        ResearchArea,
+    )
+    from ai_research_assistant.readme_parser import (
+        ReadmeParser,
+        ResearchMetadata,
+        create_research_readme_template,
+        render_research_readme_template,
+    )
+
+# Símbolo público -> submódulo que o define. Importados sob demanda (PEP 562) para
+# que `import ai_research_assistant` e CLIs como `mcp-analyze` não paguem o custo
+# de carregar o assistente inteiro.
+_LAZY_IMPORTS = {
+    "AIResearchAssistant": "ai_research_assistant.ai_research_assistant",
+    "Model": "ai_research_assistant.ai_research_assistant",
+    "Paper": "ai_research_assistant.ai_research_assistant",
+    "ProjectAnalysis": "ai_research_assistant.ai_research_assistant",
+    "ProjectMetadata": "ai_research_assistant.ai_research_assistant",
+    "ProjectMetadataExtractor": "ai_research_assistant.ai_research_assistant",
+    "ResearchArea": "ai_research_assistant.ai_research_assistant",
+    "ReadmeParser": "ai_research_assistant.readme_parser",
+    "ResearchMetadata": "ai_research_assistant.readme_parser",
+    "create_research_readme_template": "ai_research_assistant.readme_parser",
+    "render_research_readme_template": "ai_research_assistant.readme_parser",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Importa o símbolo público no primeiro acesso e o guarda no módulo"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "AIResearchAssistant",
@@ -42,4 +80,5 @@ __all__ = [
     "ReadmeParser",
     "ResearchMetadata",
     "create_research_readme_template",
+    "render_research_readme_template",
 ]
@@ -4,18 +4,33 @@
 Integra MCP tools para análise inteligente de projetos com Python 3.13
 """
 
+import ast
+import contextlib
+import functools
+import hashlib
+import json
+import logging
+import mmap
+import os
 import re
 import sys
-from dataclasses import dataclass, field
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, fields
 from enum import StrEnum
 from pathlib import Path
-from typing import Protocol
+from types import MappingProxyType
+from typing import Any, Protocol
 
-import tomli  # Para ler pyproject.toml
+from packaging.requirements import InvalidRequirement, Requirement
 
 # Importar README parser
 from ai_research_assistant.readme_parser import ReadmeParser, ResearchMetadata
 
+# Progresso e avisos da análise; a CLI configura a saída em `main()`
+logger = logging.getLogger(__name__)
+
 # ============================================================================
 # TYPE DEFINITIONS (Python 3.13 features)
 # ============================================================================
@@ -24,6 +39,21 @@ type ProjectPath = str | Path
 type PaperQuery = str
 type ModelQuery = str
 
+# Comentário de linha inteira ou após espaço no requirements.txt (mesma regra do pip).
+# Os padrões de manifesto são ASCII por natureza: re.ASCII usa as tabelas de 7 bits
+_REQ_COMMENT_RE = re.compile(r"(^|\s+)#.*$", re.ASCII)
+
+# Linhas `import ...` / `from ...` (sem indentação nem espaços finais), varridas
+# sobre o arquivo inteiro em vez de linha a linha
+_IMPORT_LINE_RE = re.compile(r"^[^\S\n]*((?:import|from) [^\n]*?\S)[^\S\n]*$", re.MULTILINE)
+
+# Campos do setup.py extraídos numa única passada: name/description (grupos 1-2)
+# ou keywords (grupo 3). Padrões em bytes: rodam direto sobre o arquivo mapeado
+_SETUP_FIELDS_RE = re.compile(
+    rb"""\b(name|description)\s*=\s*["']([^"']+)["']|\bkeywords\s*=\s*\[([^\]]+)\]""",
+    re.ASCII,
+)
+
 
 class ResearchArea(StrEnum):
     """Áreas de pesquisa suportadas"""
@@ -36,6 +66,72 @@ class ResearchArea(StrEnum):
     MODEL_CONTEXT_PROTOCOL = "model_context_protocol"
 
 
+# Mapeamento keyword/pacote -> nome da tecnologia (somente leitura)
+_TECH_MAPPING: Mapping[str, str] = MappingProxyType(
+    {
+        "numpy": "NumPy",
+        "pandas": "Pandas",
+        "matplotlib": "Matplotlib",
+        "scipy": "SciPy",
+        "sklearn": "Scikit-learn",
+        "scikit-learn": "Scikit-learn",
+        "tensorflow": "TensorFlow",
+        "torch": "PyTorch",
+        "pytorch": "PyTorch",
+        "pydantic": "Pydantic",
+        "fastapi": "FastAPI",
+        "flask": "Flask",
+        "django": "Django",
+        "streamlit": "Streamlit",
+        "mcp": "Model Context Protocol",
+        "hatch": "Hatch",
+        "pytest": "pytest",
+        "transformers": "Hugging Face Transformers",
+        "lstm": "LSTM Networks",
+        "cnn": "Convolutional Neural Networks",
+        "random forest": "Random Forest",
+        "xgboost": "XGBoost",
+    }
+)
+
+# Pares (chave, tecnologia) pré-materializados para o casamento por substring:
+# um `in` por chave (busca rápida do str, em C). Chaves sobrepostas casam
+# independentemente (ex.: "scipytest" → scipy e pytest)
+_TECH_ITEMS: tuple[tuple[str, str], ...] = tuple(_TECH_MAPPING.items())
+
+# Texto livre (seções do README) é casado por palavra: chaves de uma palavra via
+# interseção de conjuntos, chaves compostas ("random forest", "scikit-learn") via
+# substring. Palavras são sequências de [a-z0-9_]
+_WORD_RE = re.compile(r"[a-z0-9_]+")
+_TECH_WORDS: Mapping[str, str] = MappingProxyType(
+    {key: name for key, name in _TECH_ITEMS if _WORD_RE.fullmatch(key)}
+)
+_TECH_PHRASES: tuple[tuple[str, str], ...] = tuple(
+    (key, name) for key, name in _TECH_ITEMS if key not in _TECH_WORDS
+)
+
+# Mapeamento área/keyword -> query de busca de papers (somente leitura).
+# As áreas entram pelo `.value` (str puro): a busca é feita com `str(area)`, sem
+# instâncias de enum nas chaves do dict
+_QUERY_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        ResearchArea.PARTIAL_DISCHARGE.value: "partial discharge detection machine learning",
+        ResearchArea.MACHINE_LEARNING.value: "machine learning algorithms",
+        ResearchArea.DEEP_LEARNING.value: "deep learning neural networks",
+        ResearchArea.SIGNAL_PROCESSING.value: "signal processing analysis",
+        ResearchArea.MODEL_CONTEXT_PROTOCOL.value: "model context protocol llm agents",
+        "mcp": "model context protocol llm integration",
+        "ai": "artificial intelligence machine learning",
+        "anomaly detection": "anomaly detection machine learning",
+        "time series": "time series forecasting deep learning",
+        "predictive maintenance": "predictive maintenance ai",
+    }
+)
+
+# Marcadores de consultas sobre Model Context Protocol
+_MCP_QUERY_MARKERS = ("mcp", "context")
+
+
 @dataclass(slots=True, frozen=True)
 class Paper:
     """Representa um paper científico"""
@@ -60,7 +156,7 @@ class Model:
     url: str
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class ProjectMetadata:
     """Metadados extraídos do projeto"""
 
@@ -72,22 +168,33 @@ class ProjectMetadata:
     version: str = ""
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class ProjectAnalysis:
     """Resultado da análise do projeto"""
 
     project_name: str
     files_analyzed: int
-    technologies: list[str] = field(default_factory=list)
+    technologies: tuple[str, ...] = ()
     suggestions: list[str] = field(default_factory=list)
     relevant_papers: list[Paper] = field(default_factory=list)
     relevant_models: list[Model] = field(default_factory=list)
     metadata: ProjectMetadata | None = None
     research_metadata: ResearchMetadata | None = None  # ← NOVO!
-    imports: list[str] = field(default_factory=list)
+    imports: tuple[str, ...] = ()
     detection_sources: dict[str, list[str]] = field(default_factory=dict)  # ← NOVO!
 
 
+@dataclass(slots=True, frozen=True)
+class _SourceScan:
+    """Resultado da varredura de um único arquivo .py"""
+
+    path: str
+    # Tecnologias encontradas neste arquivo (numa varredura de projeto, apenas as
+    # que nenhum arquivo anterior já tinha revelado)
+    technologies: frozenset[str]
+    imports: frozenset[str]
+
+
 # ============================================================================
 # PROTOCOLS (Python 3.13 Structural Subtyping)
 # ============================================================================
@@ -106,35 +213,123 @@ class MCPClient(Protocol):
 # ============================================================================
 
 
+@contextlib.contextmanager
+def _map_file(path: str | Path) -> Iterator[bytes | mmap.mmap]:
+    """
+    Mapeia o arquivo em memória (somente leitura) para varredura com regex de bytes.
+
+    Evita decodificar o arquivo inteiro: só os trechos capturados viram `str`.
+    Arquivos vazios (que o mmap não aceita) resultam em `b""`.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+# Default compartilhado para chaves ausentes do pyproject: evita alocar `[]`/`{}` por .get()
+_EMPTY: tuple[str, ...] = ()
+_EMPTY_TABLE: Mapping[str, Any] = MappingProxyType({})
+
+
+def _intern_all(items: Iterable[str]) -> list[str]:
+    """
+    Interna as strings para que nomes repetidos (deps, keywords) compartilhem um objeto.
+
+    Duplicatas são descartadas via `dict.fromkeys`, preservando a ordem original.
+    """
+    return list(dict.fromkeys(map(sys.intern, items)))
+
+
+@functools.lru_cache(maxsize=128)
+def _load_pyproject(pyproject_path: str, mtime_ns: int) -> dict[str, Any]:
+    """
+    Carrega o pyproject.toml uma única vez por versão do arquivo.
+
+    O `mtime_ns` faz parte da chave do cache: arquivos inalterados não são reparseados.
+    O dict retornado é compartilhado entre chamadas e não deve ser modificado.
+    """
+    import tomllib  # Importado sob demanda: só necessário quando há pyproject.toml
+
+    return tomllib.loads(Path(pyproject_path).read_text(encoding="utf-8"))
+
+
+def _read_pyproject(project_path: Path) -> dict[str, Any] | None:
+    """pyproject.toml do projeto já parseado (via `_load_pyproject`), ou None se ausente"""
+    pyproject_path = project_path / "pyproject.toml"
+    try:
+        mtime_ns = pyproject_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _load_pyproject(str(pyproject_path), mtime_ns)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_setup_py(setup_path: str, mtime_ns: int) -> tuple[str | None, tuple[str, ...], str]:
+    """
+    Lê name, keywords e description do setup.py numa única passada.
+
+    O `mtime_ns` faz parte da chave do cache: arquivos inalterados não são relidos.
+    """
+    name: str | None = None
+    keywords: tuple[str, ...] | None = None
+    description: str | None = None
+
+    with _map_file(setup_path) as content:
+        for match in _SETUP_FIELDS_RE.finditer(content):
+            if match.lastindex == 3:
+                if keywords is None:
+                    raw_keywords = match.group(3).decode("utf-8", errors="replace").split(",")
+                    keywords = tuple(
+                        dict.fromkeys(filter(None, (k.strip(" \"'\n\t") for k in raw_keywords)))
+                    )
+            elif match.group(1) == b"name":
+                if name is None:
+                    name = match.group(2).decode("utf-8", errors="replace")
+            elif description is None:
+                description = match.group(2).decode("utf-8", errors="replace")
+
+    return name, keywords or (), description or ""
+
+
 class ProjectMetadataExtractor:
     """Extrai metadados de diferentes formatos de projeto"""
 
     @staticmethod
-    def extract_from_pyproject(project_path: Path) -> ProjectMetadata | None:
-        """Extrai metadados de pyproject.toml"""
-        pyproject_path = project_path / "pyproject.toml"
-
-        if not pyproject_path.exists():
-            return None
+    def extract_from_pyproject(
+        project_path: Path, parsed: Mapping[str, Any] | None = None
+    ) -> ProjectMetadata | None:
+        """
+        Extrai metadados de pyproject.toml.
 
+        Args:
+            project_path: Diretório do projeto
+            parsed: Conteúdo já parseado do pyproject.toml; lido do disco se omitido
+        """
         try:
-            with open(pyproject_path, "rb") as f:
-                data = tomli.load(f)
+            data = parsed if parsed is not None else _read_pyproject(project_path)
+            if data is None:
+                return None
 
-            project_data = data.get("project", {})
+            project_data = data.get("project") or _EMPTY_TABLE
 
+            # Novas listas: o dict parseado fica no cache e é compartilhado
             metadata = ProjectMetadata(
                 name=project_data.get("name", project_path.name),
-                keywords=project_data.get("keywords", []),
-                dependencies=project_data.get("dependencies", []),
-                dev_dependencies=project_data.get("optional-dependencies", {}).get("dev", []),
+                keywords=_intern_all(project_data.get("keywords") or _EMPTY),
+                dependencies=_intern_all(project_data.get("dependencies") or _EMPTY),
+                dev_dependencies=_intern_all(
+                    (project_data.get("optional-dependencies") or _EMPTY_TABLE).get("dev") or _EMPTY
+                ),
                 description=project_data.get("description", ""),
                 version=project_data.get("version", ""),
             )
 
             return metadata
         except Exception as e:
-            print(f"⚠️  Erro ao ler pyproject.toml: {e}")
+            logger.warning(f"⚠️  Erro ao ler pyproject.toml: {e}")
             return None
 
     @staticmethod
@@ -146,15 +341,20 @@ class ProjectMetadataExtractor:
             return []
 
         try:
-            content = req_path.read_text()
-            deps = [
-                line.split("==")[0].split(">=")[0].split("<=")[0].strip()
-                for line in content.split("\n")
-                if line.strip() and not line.strip().startswith("#")
-            ]
-            return deps
+            deps: dict[str, None] = {}  # dict ordenado como conjunto: dedup O(1)
+            with open(req_path, encoding="utf-8") as f:
+                for line in f:
+                    line = _REQ_COMMENT_RE.sub("", line).strip()
+                    # Linhas vazias e opções do pip (-r, -e, --index-url, ...)
+                    if not line or line.startswith("-"):
+                        continue
+                    try:
+                        deps[sys.intern(Requirement(line).name)] = None
+                    except InvalidRequirement:
+                        continue
+            return list(deps)
         except Exception as e:
-            print(f"⚠️  Erro ao ler requirements.txt: {e}")
+            logger.warning(f"⚠️  Erro ao ler requirements.txt: {e}")
             return []
 
     @staticmethod
@@ -166,23 +366,152 @@ class ProjectMetadataExtractor:
             return None
 
         try:
-            content = setup_path.read_text()
+            name, keywords, description = _parse_setup_py(
+                str(setup_path), setup_path.stat().st_mtime_ns
+            )
 
-            name_match = re.search(r'name\s*=\s*["\']([^"\']+)["\']', content)
-            name = name_match.group(1) if name_match else project_path.name
+            return ProjectMetadata(
+                name=name or project_path.name,
+                keywords=_intern_all(keywords),
+                description=description,
+            )
+        except Exception as e:
+            logger.warning(f"⚠️  Erro ao ler setup.py: {e}")
+            return None
 
-            keywords_match = re.search(r"keywords\s*=\s*\[([^\]]+)\]", content)
-            keywords = []
-            if keywords_match:
-                keywords = [k.strip(" \"'") for k in keywords_match.group(1).split(",")]
 
-            desc_match = re.search(r'description\s*=\s*["\']([^"\']+)["\']', content)
-            description = desc_match.group(1) if desc_match else ""
+# ============================================================================
+# FILESYSTEM WALK
+# ============================================================================
 
-            return ProjectMetadata(name=name, keywords=keywords, description=description)
-        except Exception as e:
-            print(f"⚠️  Erro ao ler setup.py: {e}")
+# Workers da varredura de arquivos: I/O-bound, então acima do número de CPUs
+_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+
+# Limites de leitura dos .py: acima de _MAX_SOURCE_BYTES o arquivo é ignorado (e não
+# conta em files_analyzed); abaixo, só os primeiros _SOURCE_READ_LIMIT bytes são lidos
+_MAX_SOURCE_BYTES = 4_000_000
+_SOURCE_READ_LIMIT = 1 << 20
+
+# Diretórios que nunca contêm código do projeto (VCS, caches, ambientes virtuais,
+# artefatos de build). Diretórios ocultos (".algo") também são ignorados
+_SKIP_DIRS = frozenset(
+    {
+        ".git",
+        "__pycache__",
+        ".venv",
+        "venv",
+        "node_modules",
+        "build",
+        "dist",
+        ".tox",
+        ".mypy_cache",
+        ".pytest_cache",
+        "site-packages",
+    }
+)
+
+
+def _walk_py_files(root: str) -> Iterator[str]:
+    """
+    Percorre `root` recursivamente com os.scandir e gera os caminhos dos .py.
+
+    Trabalha com strings em vez de Path (sem alocar um objeto por entrada) e não
+    desce em `_SKIP_DIRS`, em diretórios ocultos nem segue symlinks de diretórios.
+    Diretórios inexistentes ou ilegíveis são pulados, como faz `Path.rglob`.
+    """
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SKIP_DIRS and not entry.name.startswith("."):
+                        stack.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    yield entry.path
+
+
+def _read_source(py_file: str) -> str | None:
+    """
+    Lê um arquivo .py como texto, ignorando bytes que não são UTF-8.
+
+    Arquivos maiores que `_MAX_SOURCE_BYTES` (em geral código gerado) são ignorados
+    (retorna None) e, nos demais, só os primeiros `_SOURCE_READ_LIMIT` bytes são
+    lidos: imports e tecnologias aparecem no início do arquivo e a memória fica limitada.
+    """
+    with open(py_file, "rb") as f:
+        if os.fstat(f.fileno()).st_size > _MAX_SOURCE_BYTES:
             return None
+        return f.read(_SOURCE_READ_LIMIT).decode("utf-8", errors="ignore")
+
+
+# ============================================================================
+# ANALYSIS CACHE
+# ============================================================================
+
+# Incrementar quando o formato (ou o significado) de ProjectAnalysis mudar,
+# invalidando caches antigos
+_CACHE_VERSION = 2
+
+# Arquivos de metadados que, junto com os .py, determinam o resultado da análise
+_MANIFEST_FILES = ("pyproject.toml", "setup.py", "requirements.txt", "README.md")
+
+
+def _default_cache_dir() -> Path | None:
+    """
+    Diretório padrão do cache de análises usado pela CLI.
+
+    Resolvido só quando a CLI roda (não no import): `Path.home()` levanta
+    RuntimeError sem um diretório home resolvível (containers, usuários de CI),
+    e nesse caso a análise segue sem cache.
+    """
+    try:
+        return Path.home() / ".cache" / "ai_research_assistant"
+    except RuntimeError as e:
+        logger.warning(f"⚠️  Cache de análise desativado: {e}")
+        return None
+
+
+def _analysis_cache_key(project_path: Path) -> str:
+    """Hash de (caminho, mtime, tamanho) dos manifests e de todos os .py do projeto"""
+    root = str(project_path)
+    paths = [str(project_path / name) for name in _MANIFEST_FILES]
+    paths.extend(sorted(_walk_py_files(root)))
+
+    digest = hashlib.blake2b(f"{_CACHE_VERSION}\0{project_path.resolve()}".encode())
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            continue
+        digest.update(f"\0{os.path.relpath(path, root)}\0{st.st_mtime_ns}\0{st.st_size}".encode())
+    return digest.hexdigest()
+
+
+def _analysis_to_dict(analysis: ProjectAnalysis) -> dict[str, Any]:
+    """Converte ProjectAnalysis em dict serializável em JSON"""
+    return asdict(analysis)
+
+
+def _analysis_from_dict(data: dict[str, Any]) -> ProjectAnalysis:
+    """Reconstrói ProjectAnalysis (e dataclasses aninhadas) a partir de `_analysis_to_dict`"""
+    known = {f.name for f in fields(ProjectAnalysis)}
+    values = {key: value for key, value in data.items() if key in known}
+
+    metadata = values.get("metadata")
+    research_metadata = values.get("research_metadata")
+    values.update(
+        technologies=tuple(values.get("technologies", ())),
+        imports=tuple(map(sys.intern, values.get("imports", ()))),
+        relevant_papers=[Paper(**paper) for paper in values.get("relevant_papers", [])],
+        relevant_models=[Model(**model) for model in values.get("relevant_models", [])],
+        metadata=ProjectMetadata(**metadata) if metadata else None,
+        research_metadata=ResearchMetadata(**research_metadata) if research_metadata else None,
+    )
+    return ProjectAnalysis(**values)
 
 
 # ============================================================================
@@ -203,15 +532,54 @@ class AIResearchAssistant:
     - 📄 Lê e interpreta README.md estruturado (4ª FONTE!)
     """
 
-    def __init__(self, project_path: ProjectPath):
+    def __init__(
+        self, project_path: ProjectPath, cache_dir: Path | None = None, verbose: bool = False
+    ):
+        """
+        Args:
+            project_path: Diretório do projeto a analisar
+            cache_dir: Se informado, análises são persistidas em JSON neste diretório
+                e reaproveitadas enquanto o projeto não mudar
+            verbose: Se True, imprime cada tecnologia detectada e a fonte da detecção
+        """
         self.project_path = Path(project_path)
+        self.cache_dir = cache_dir
+        self.verbose = verbose
         self.analysis: ProjectAnalysis | None = None
+        # Último relatório renderizado e a análise (imutável) que o originou
+        self._report_memo: tuple[ProjectAnalysis, str] | None = None
         self.metadata_extractor = ProjectMetadataExtractor()
         self.readme_parser = ReadmeParser()
 
+    @property
+    def analysis(self) -> ProjectAnalysis | None:
+        """Última análise do projeto (None antes de `analyze_project()`)"""
+        return self._analysis
+
+    @analysis.setter
+    def analysis(self, value: ProjectAnalysis | None) -> None:
+        self._analysis = value
+        # Papers e sugestões memorizados dependem da análise anterior
+        for name in ("default_papers", "improvement_suggestions"):
+            self.__dict__.pop(name, None)
+
     def analyze_project(self) -> ProjectAnalysis:
         """Analisa o projeto completo"""
-        print(f"🔍 Analisando projeto: {self.project_path}")
+        logger.info(f"🔍 Analisando projeto: {self.project_path}")
+
+        cache_path = None
+        if self.cache_dir is not None:
+            try:
+                cache_key = _analysis_cache_key(self.project_path)
+            except OSError as e:
+                # Sem chave confiável, a análise segue sem cache
+                logger.warning(f"⚠️  Cache de análise desativado: {e}")
+            else:
+                cache_path = self.cache_dir / f"{cache_key}.json"
+                cached = self._load_cached_analysis(cache_path)
+                if cached is not None:
+                    self.analysis = cached
+                    return cached
 
         # Extrair metadados do projeto
         metadata = self._extract_project_metadata()
@@ -219,82 +587,187 @@ class AIResearchAssistant:
         # Extrair metadados de pesquisa do README (4ª FONTE!)
         research_metadata = self._extract_research_metadata()
 
+        # Percorrer e varrer os .py uma única vez: detecção e imports usam o mesmo resultado
+        scans = self._scan_sources()
+
         # Detectar tecnologias (agora usa 4 fontes!)
-        technologies, detection_sources = self._detect_technologies(metadata, research_metadata)
+        technologies, detection_sources = self._detect_technologies(
+            metadata, research_metadata, scans
+        )
 
         # Extrair imports reais
-        imports = self._extract_imports()
-
-        # Contar arquivos
-        files = list(self.project_path.rglob("*.py"))
+        imports = self._extract_imports(scans)
 
         # Criar análise inicial
         analysis = ProjectAnalysis(
             project_name=metadata.name if metadata else self.project_path.name,
-            files_analyzed=len(files),
-            technologies=technologies,
+            files_analyzed=len(scans),
+            technologies=tuple(technologies),
             metadata=metadata,
             research_metadata=research_metadata,
-            imports=imports,
+            imports=tuple(imports),
             detection_sources=detection_sources,
         )
 
+        if cache_path is not None:
+            self._store_cached_analysis(cache_path, analysis)
+
         self.analysis = analysis
         return analysis
 
+    @staticmethod
+    def _load_cached_analysis(cache_path: Path) -> ProjectAnalysis | None:
+        """Carrega uma análise do cache em disco, se existir e for legível"""
+        if not cache_path.exists():
+            return None
+
+        try:
+            analysis = _analysis_from_dict(json.loads(cache_path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"   ⚠️  Cache inválido ignorado ({cache_path.name}): {e}")
+            return None
+
+        logger.info(f"   ♻️  Análise carregada do cache: {cache_path}")
+        return analysis
+
+    @staticmethod
+    def _store_cached_analysis(cache_path: Path, analysis: ProjectAnalysis) -> None:
+        """Persiste a análise no cache em disco (falhas não interrompem a análise)"""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(
+                json.dumps(_analysis_to_dict(analysis), ensure_ascii=False), encoding="utf-8"
+            )
+        except OSError as e:
+            logger.warning(f"   ⚠️  Não foi possível gravar o cache: {e}")
+
     def _extract_project_metadata(self) -> ProjectMetadata | None:
         """Extrai metadados do projeto de múltiplas fontes"""
-        print("   📦 Extraindo metadados do projeto...")
+        logger.info("   📦 Extraindo metadados do projeto...")
 
-        metadata = self.metadata_extractor.extract_from_pyproject(self.project_path)
+        try:
+            pyproject = _read_pyproject(self.project_path)
+        except Exception as e:
+            logger.warning(f"⚠️  Erro ao ler pyproject.toml: {e}")
+            pyproject = None
+
+        # A tabela [project] (PEP 621) é autoritativa: sem ela, seguir para setup.py
+        # e requirements.txt. O dict já parseado é repassado ao extrator
+        metadata = None
+        if pyproject is not None and "project" in pyproject:
+            metadata = self.metadata_extractor.extract_from_pyproject(
+                self.project_path, parsed=pyproject
+            )
 
         if metadata:
-            print("      ✓ pyproject.toml encontrado")
+            logger.info("      ✓ pyproject.toml encontrado")
             if metadata.keywords:
-                print(f"      ✓ Keywords: {', '.join(metadata.keywords)}")
+                logger.info(f"      ✓ Keywords: {', '.join(metadata.keywords)}")
             if metadata.dependencies:
-                print(f"      ✓ {len(metadata.dependencies)} dependências")
+                logger.info(f"      ✓ {len(metadata.dependencies)} dependências")
             return metadata
 
         metadata = self.metadata_extractor.extract_from_setup_py(self.project_path)
         if metadata:
-            print("      ✓ setup.py encontrado")
+            logger.info("      ✓ setup.py encontrado")
             return metadata
 
         deps = self.metadata_extractor.extract_from_requirements(self.project_path)
         if deps:
-            print(f"      ✓ requirements.txt encontrado ({len(deps)} deps)")
+            logger.info(f"      ✓ requirements.txt encontrado ({len(deps)} deps)")
             return ProjectMetadata(name=self.project_path.name, dependencies=deps)
 
-        print("      ⚠️  Nenhum arquivo de metadados encontrado")
+        logger.warning("      ⚠️  Nenhum arquivo de metadados encontrado")
         return ProjectMetadata(name=self.project_path.name)
 
     def _extract_research_metadata(self) -> ResearchMetadata | None:
         """Extrai metadados de pesquisa do README.md (4ª FONTE!)"""
-        print("   📄 Extraindo metadados de pesquisa do README...")
+        logger.info("   📄 Extraindo metadados de pesquisa do README...")
 
         readme_path = self.project_path / "README.md"
-        research_metadata = self.readme_parser.parse(readme_path)
+        research_metadata = self.readme_parser.parse(
+            readme_path, cache_dir=self.cache_dir and self.cache_dir / "readme"
+        )
 
         if research_metadata:
-            print("      ✓ README.md encontrado e parseado")
+            logger.info("      ✓ README.md encontrado e parseado")
 
             if research_metadata.research_focus:
-                print(f"      ✓ Research Focus: {', '.join(research_metadata.research_focus[:2])}")
+                logger.info(
+                    f"      ✓ Research Focus: {', '.join(research_metadata.research_focus[:2])}"
+                )
 
             if research_metadata.keywords:
-                print(f"      ✓ Keywords: {', '.join(research_metadata.keywords[:5])}")
+                logger.info(f"      ✓ Keywords: {', '.join(research_metadata.keywords[:5])}")
 
             if research_metadata.research_questions:
-                print(f"      ✓ {len(research_metadata.research_questions)} perguntas de pesquisa")
+                logger.info(
+                    f"      ✓ {len(research_metadata.research_questions)} perguntas de pesquisa"
+                )
 
             return research_metadata
         else:
-            print("      ⚠️  README.md não encontrado ou sem seções de pesquisa")
+            logger.warning("      ⚠️  README.md não encontrado ou sem seções de pesquisa")
             return None
 
+    def _scan_sources(self) -> list[_SourceScan]:
+        """Varre todos os .py do projeto numa única travessia, um arquivo por worker"""
+        try:
+            # Leitura, decode e casamento de cada arquivo rodam nos workers: o read
+            # libera o GIL (e em builds free-threaded o CPU também paraleliza).
+            # Só a agregação dos resultados fica na thread principal.
+            # `found` é compartilhado: chaves já vistas em qualquer arquivo não são
+            # procuradas de novo (corridas só causam buscas redundantes, nunca perdas)
+            found: set[str] = set()
+            scan = functools.partial(self._scan_file, found=found)
+            with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as executor:
+                scans = executor.map(scan, _walk_py_files(str(self.project_path)))
+                # Arquivos ignorados por tamanho não entram (nem em files_analyzed)
+                return [scan for scan in scans if scan is not None]
+        except Exception as e:
+            logger.warning(f"⚠️  Erro ao ler arquivos Python: {e}")
+            return []
+
+    @classmethod
+    def _scan_file(cls, py_file: str, found: set[str] | None = None) -> _SourceScan | None:
+        """
+        Lê um arquivo .py e extrai tecnologias e imports do seu conteúdo.
+
+        Com `found`, só as chaves de tecnologia ainda não encontradas são procuradas
+        (e as novas são registradas nele); quando todas já foram vistas, o arquivo
+        nem é convertido para minúsculas. Um arquivo ilegível (symlink quebrado,
+        sem permissão) gera uma varredura vazia, sem afetar os demais; um arquivo
+        acima de `_MAX_SOURCE_BYTES` não é varrido e retorna None.
+        """
+        try:
+            content = _read_source(py_file)
+        except OSError as e:
+            logger.warning(f"⚠️  Erro ao ler {py_file}: {e}")
+            return _SourceScan(path=py_file, technologies=frozenset(), imports=frozenset())
+        if content is None:
+            return None
+        if found is None:
+            technologies = cls._match_technologies(content.lower())
+        elif len(found) < len(_TECH_ITEMS):
+            content_lower = content.lower()
+            technologies = set()
+            for tech_key, tech_name in _TECH_ITEMS:
+                if tech_key not in found and tech_key in content_lower:
+                    found.add(tech_key)
+                    technologies.add(tech_name)
+        else:
+            technologies = ()
+        return _SourceScan(
+            path=py_file,
+            technologies=frozenset(technologies),
+            imports=frozenset(cls._scan_imports(content)),
+        )
+
     def _detect_technologies(
-        self, metadata: ProjectMetadata | None, research_metadata: ResearchMetadata | None
+        self,
+        metadata: ProjectMetadata | None,
+        research_metadata: ResearchMetadata | None,
+        scans: Sequence[_SourceScan] | None = None,
     ) -> tuple[list[str], dict[str, list[str]]]:
         """
         Detecta tecnologias usadas no projeto.
@@ -305,101 +778,65 @@ class AIResearchAssistant:
         3. Imports no código
         4. README.md seções (NOVO!)
 
+        Args:
+            scans: Varredura dos .py já feita (ver `_scan_sources`); feita aqui se omitida
+
         Returns:
             tuple: (tecnologias detectadas, fontes de detecção)
         """
-        tech_mapping = {
-            "numpy": "NumPy",
-            "pandas": "Pandas",
-            "matplotlib": "Matplotlib",
-            "scipy": "SciPy",
-            "sklearn": "Scikit-learn",
-            "scikit-learn": "Scikit-learn",
-            "tensorflow": "TensorFlow",
-            "torch": "PyTorch",
-            "pytorch": "PyTorch",
-            "pydantic": "Pydantic",
-            "fastapi": "FastAPI",
-            "flask": "Flask",
-            "django": "Django",
-            "streamlit": "Streamlit",
-            "mcp": "Model Context Protocol",
-            "hatch": "Hatch",
-            "pytest": "pytest",
-            "transformers": "Hugging Face Transformers",
-            "lstm": "LSTM Networks",
-            "cnn": "Convolutional Neural Networks",
-            "random forest": "Random Forest",
-            "xgboost": "XGBoost",
-        }
 
-        detected = {}  # tech_name -> [sources]
+        detected: defaultdict[str, set[str]] = defaultdict(set)  # tech_name -> fontes
+        verbose = self.verbose
 
         # FONTE 1: Keywords do pyproject.toml
         if metadata and metadata.keywords:
-            print("   🔍 Fonte 1: Analisando keywords do projeto...")
+            logger.info("   🔍 Fonte 1: Analisando keywords do projeto...")
             for keyword in metadata.keywords:
-                keyword_lower = keyword.lower()
-                for tech_key, tech_name in tech_mapping.items():
-                    if tech_key in keyword_lower:
-                        if tech_name not in detected:
-                            detected[tech_name] = []
-                        if "pyproject.toml keywords" not in detected[tech_name]:
-                            detected[tech_name].append("pyproject.toml keywords")
-                            print(f"      ✓ '{tech_name}' via keyword '{keyword}'")
+                for tech_name in self._lookup_technologies(keyword.lower()):
+                    if verbose and "pyproject.toml keywords" not in detected[tech_name]:
+                        logger.info(f"      ✓ '{tech_name}' via keyword '{keyword}'")
+                    detected[tech_name].add("pyproject.toml keywords")
 
         # FONTE 2: Dependencies
         if metadata and metadata.dependencies:
-            print("   🔍 Fonte 2: Analisando dependências...")
+            logger.info("   🔍 Fonte 2: Analisando dependências...")
             for dep in metadata.dependencies:
-                dep_name = dep.split(">=")[0].split("==")[0].split("[")[0].lower().strip()
-                if dep_name in tech_mapping:
-                    tech_name = tech_mapping[dep_name]
-                    if tech_name not in detected:
-                        detected[tech_name] = []
-                    if "dependencies" not in detected[tech_name]:
-                        detected[tech_name].append("dependencies")
-                        print(f"      ✓ '{tech_name}' via dependência")
+                # Nome PEP 508: descarta extras, operadores de versão, markers e URLs
+                try:
+                    dep_name = Requirement(dep).name.lower()
+                except InvalidRequirement:
+                    continue
+                if dep_name in _TECH_MAPPING:
+                    tech_name = _TECH_MAPPING[dep_name]
+                    if verbose and "dependencies" not in detected[tech_name]:
+                        logger.info(f"      ✓ '{tech_name}' via dependência")
+                    detected[tech_name].add("dependencies")
 
         # FONTE 3: Imports no código
-        print("   🔍 Fonte 3: Analisando imports no código...")
-        try:
-            for py_file in self.project_path.rglob("*.py"):
-                content = py_file.read_text(encoding="utf-8", errors="ignore")
-                for tech_key, tech_name in tech_mapping.items():
-                    if tech_key in content.lower():
-                        if tech_name not in detected:
-                            detected[tech_name] = []
-                        if "code imports" not in detected[tech_name]:
-                            detected[tech_name].append("code imports")
-        except Exception as e:
-            print(f"      ⚠️  Erro: {e}")
+        logger.info("   🔍 Fonte 3: Analisando imports no código...")
+        if scans is None:
+            scans = self._scan_sources()
+        for scan in scans:
+            for tech_name in scan.technologies:
+                detected[tech_name].add("code imports")
 
         # FONTE 4: README.md (NOVO!)
         if research_metadata:
-            print("   🔍 Fonte 4: Analisando README.md...")
+            logger.info("   🔍 Fonte 4: Analisando README.md...")
 
             # 4a. Technologies explícitas
             for tech in research_metadata.technologies:
-                tech_lower = tech.lower()
-                for tech_key, tech_name in tech_mapping.items():
-                    if tech_key in tech_lower:
-                        if tech_name not in detected:
-                            detected[tech_name] = []
-                        if "README technologies" not in detected[tech_name]:
-                            detected[tech_name].append("README technologies")
-                            print(f"      ✓ '{tech_name}' via README technologies")
+                for tech_name in self._lookup_technologies(tech.lower()):
+                    if verbose and "README technologies" not in detected[tech_name]:
+                        logger.info(f"      ✓ '{tech_name}' via README technologies")
+                    detected[tech_name].add("README technologies")
 
             # 4b. Keywords de pesquisa
             for keyword in research_metadata.keywords:
-                keyword_lower = keyword.lower()
-                for tech_key, tech_name in tech_mapping.items():
-                    if tech_key in keyword_lower:
-                        if tech_name not in detected:
-                            detected[tech_name] = []
-                        if "README keywords" not in detected[tech_name]:
-                            detected[tech_name].append("README keywords")
-                            print(f"      ✓ '{tech_name}' via README keyword '{keyword}'")
+                for tech_name in self._lookup_technologies(keyword.lower()):
+                    if verbose and "README keywords" not in detected[tech_name]:
+                        logger.info(f"      ✓ '{tech_name}' via README keyword '{keyword}'")
+                    detected[tech_name].add("README keywords")
 
             # 4c. Research Focus e Methodology
             all_research_text = " ".join(
@@ -408,37 +845,73 @@ class AIResearchAssistant:
                 + research_metadata.research_questions
             ).lower()
 
-            for tech_key, tech_name in tech_mapping.items():
-                if tech_key in all_research_text:
-                    if tech_name not in detected:
-                        detected[tech_name] = []
-                    if "README research focus" not in detected[tech_name]:
-                        detected[tech_name].append("README research focus")
-                        print(f"      ✓ '{tech_name}' via README research sections")
+            for tech_name in self._match_technology_words(all_research_text):
+                if verbose and "README research focus" not in detected[tech_name]:
+                    logger.info(f"      ✓ '{tech_name}' via README research sections")
+                detected[tech_name].add("README research focus")
 
         # Ordenar por nome e retornar
-        sorted_techs = sorted(detected.keys())
-        detection_sources = {tech: detected[tech] for tech in sorted_techs}
+        sorted_techs = sorted(detected)
+        detection_sources = {tech: sorted(detected[tech]) for tech in sorted_techs}
 
         return sorted_techs, detection_sources
 
-    def _extract_imports(self) -> list[str]:
-        """Extrai todos os imports únicos do projeto"""
+    @classmethod
+    def _lookup_technologies(cls, term_lower: str) -> Iterable[str]:
+        """
+        Tecnologias de um termo curto (keyword, nome de pacote) já em minúsculas.
+
+        Termos que são exatamente uma chave (o caso comum: "numpy", "mcp") saem de
+        um único lookup no dict; só os demais passam pela busca por substring.
+        """
+        direct = _TECH_MAPPING.get(term_lower)
+        if direct is not None:
+            return (direct,)
+        return cls._match_technologies(term_lower)
+
+    @staticmethod
+    def _match_technology_words(text_lower: str) -> set[str]:
+        """Tecnologias citadas como palavras inteiras em texto livre (já em minúsculas)"""
+        words = set(_WORD_RE.findall(text_lower))
+        found = {_TECH_WORDS[word] for word in words & _TECH_WORDS.keys()}
+        found.update(name for phrase, name in _TECH_PHRASES if phrase in text_lower)
+        return found
+
+    @staticmethod
+    def _match_technologies(text_lower: str) -> set[str]:
+        """Tecnologias cujas chaves aparecem em `text_lower` (já em minúsculas)"""
+        return {tech_name for tech_key, tech_name in _TECH_ITEMS if tech_key in text_lower}
+
+    def _extract_imports(self, scans: Sequence[_SourceScan] | None = None) -> list[str]:
+        """Extrai todos os imports únicos do projeto (dos `scans` já feitos, se dados)"""
+        if scans is None:
+            scans = self._scan_sources()
+
         imports = set()
+        for scan in scans:
+            imports.update(scan.imports)
 
-        try:
-            for py_file in self.project_path.rglob("*.py"):
-                content = py_file.read_text(encoding="utf-8", errors="ignore")
-                import_lines = [
-                    line.strip()
-                    for line in content.split("\n")
-                    if line.strip().startswith(("import ", "from "))
-                ]
-                imports.update(import_lines)
-        except Exception as e:
-            print(f"⚠️  Erro ao extrair imports: {e}")
+        return sorted(imports)
 
-        return sorted(list(imports))
+    @staticmethod
+    def _scan_imports(content: str) -> set[str]:
+        """
+        Retorna os imports do conteúdo de um arquivo Python.
+
+        Usa a AST: imports em várias linhas são normalizados para uma só e texto
+        dentro de strings/docstrings não é confundido com import. Arquivos que não
+        parseiam caem na varredura por linhas (`_IMPORT_LINE_RE`). As linhas são
+        internadas: o mesmo import repetido em muitos arquivos vira um único objeto.
+        """
+        try:
+            tree = ast.parse(content)
+        except (SyntaxError, ValueError):
+            return {sys.intern(m.group(1)) for m in _IMPORT_LINE_RE.finditer(content)}
+        return {
+            sys.intern(ast.unparse(node))
+            for node in ast.walk(tree)
+            if isinstance(node, (ast.Import, ast.ImportFrom))
+        }
 
     def search_relevant_research(
         self, area: ResearchArea | str | None = None, max_papers: int = 5
@@ -451,7 +924,20 @@ class AIResearchAssistant:
         2. Senão, usar research metadata do README
         3. Senão, usar keywords do pyproject.toml
         4. Senão, área padrão
+
+        A busca padrão (sem área, 5 papers) é memorizada em `default_papers`.
         """
+        if area is None and max_papers == 5:
+            return list(self.default_papers)
+        return self._compute_papers(area, max_papers)
+
+    @functools.cached_property
+    def default_papers(self) -> tuple[Paper, ...]:
+        """Papers da busca padrão, calculados uma vez por análise"""
+        return tuple(self._compute_papers(None, 5))
+
+    def _compute_papers(self, area: ResearchArea | str | None, max_papers: int) -> list[Paper]:
+        """Executa a busca de papers (ver `search_relevant_research`)"""
         # Usar research metadata do README (NOVO!)
         if area is None and self.analysis and self.analysis.research_metadata:
             research_meta = self.analysis.research_metadata
@@ -460,9 +946,9 @@ class AIResearchAssistant:
             queries = self.readme_parser.extract_research_queries(research_meta)
 
             if queries:
-                print("📚 Buscando papers baseado em README:")
+                logger.info("📚 Buscando papers baseado em README:")
                 for i, q in enumerate(queries[:3], 1):
-                    print(f"   {i}. {q}")
+                    logger.info(f"   {i}. {q}")
 
                 # Usar primeira query
                 area = queries[0]
@@ -471,33 +957,22 @@ class AIResearchAssistant:
         elif area is None and self.analysis and self.analysis.metadata:
             keywords = self.analysis.metadata.keywords
             if keywords:
-                print(f"📚 Buscando papers baseado em keywords: {', '.join(keywords)}")
+                logger.info(f"📚 Buscando papers baseado em keywords: {', '.join(keywords)}")
                 area = keywords[0]
             else:
                 area = ResearchArea.MACHINE_LEARNING
         elif area is None:
             area = ResearchArea.MACHINE_LEARNING
 
-        print(f"📚 Query final: {area}")
-
-        # Query mapping (expandido)
-        query_map = {
-            ResearchArea.PARTIAL_DISCHARGE: "partial discharge detection machine learning",
-            ResearchArea.MACHINE_LEARNING: "machine learning algorithms",
-            ResearchArea.DEEP_LEARNING: "deep learning neural networks",
-            ResearchArea.SIGNAL_PROCESSING: "signal processing analysis",
-            ResearchArea.MODEL_CONTEXT_PROTOCOL: "model context protocol llm agents",
-            "mcp": "model context protocol llm integration",
-            "ai": "artificial intelligence machine learning",
-            "anomaly detection": "anomaly detection machine learning",
-            "time series": "time series forecasting deep learning",
-            "predictive maintenance": "predictive maintenance ai",
-        }
+        # Converte a área (enum ou texto) para str uma única vez
+        area_key = str(area)
+        query = _QUERY_MAP.get(area_key, area_key)
 
-        query = query_map.get(area, str(area))
+        logger.info(f"📚 Query final: {query}")
 
         # Simulação de papers (em produção, chamaria MCP)
-        if "mcp" in str(area).lower() or "context" in str(area).lower():
+        area_lower = area_key.lower()
+        if any(marker in area_lower for marker in _MCP_QUERY_MARKERS):
             papers = [
                 Paper(
                     title="Model Context Protocol: Standardizing LLM-Tool Integration",
@@ -524,6 +999,11 @@ class AIResearchAssistant:
 
     def suggest_improvements(self) -> list[str]:
         """Sugere melhorias baseadas na análise"""
+        return list(self.improvement_suggestions)
+
+    @functools.cached_property
+    def improvement_suggestions(self) -> tuple[str, ...]:
+        """Sugestões de melhoria, calculadas uma vez por análise"""
         if not self.analysis:
             raise ValueError("Execute analyze_project() primeiro")
 
@@ -568,88 +1048,103 @@ class AIResearchAssistant:
             ]
         )
 
-        return suggestions
+        return tuple(suggestions)
 
     def generate_report(self, output_path: Path | None = None) -> str:
         """Gera relatório completo da análise"""
         if not self.analysis:
             raise ValueError("Execute analyze_project() primeiro")
 
-        papers = self.search_relevant_research()
-        suggestions = self.suggest_improvements()
-
-        # Seção de metadados
-        metadata_section = ""
-        if self.analysis.metadata:
-            m = self.analysis.metadata
-            metadata_section = f"""
-📦 METADADOS DO PROJETO:
-   • Nome: {m.name}
-   • Versão: {m.version or "N/A"}
-   • Keywords: {", ".join(m.keywords) if m.keywords else "Nenhuma"}
-   • Dependências: {len(m.dependencies)} principais"""
-
-        # Seção de research metadata (NOVO!)
-        research_section = ""
-        if self.analysis.research_metadata:
-            rm = self.analysis.research_metadata
-            research_section = f"""
-🔬 METADADOS DE PESQUISA (README):
-   • Research Focus: {", ".join(rm.research_focus) if rm.research_focus else "N/A"}
-   • Keywords: {", ".join(rm.keywords[:5]) if rm.keywords else "N/A"}
-   • Perguntas: {len(rm.research_questions)} questões de pesquisa
-   • Objetivos: {len(rm.goals)} objetivos definidos
-   • Metodologia: {len(rm.methodology)} etapas"""
-
-        # Seção de fontes de detecção (NOVO!)
-        sources_section = ""
-        if self.analysis.detection_sources:
-            sources_section = "\n🔍 FONTES DE DETECÇÃO:\n"
-            for tech, sources in list(self.analysis.detection_sources.items())[:5]:
-                sources_str = ", ".join(sources)
-                sources_section += f"   • {tech}: {sources_str}\n"
-
-        report = f"""
-╔══════════════════════════════════════════════════════════════╗
-║          🤖 AI RESEARCH ASSISTANT - REPORT                  ║
-╚══════════════════════════════════════════════════════════════╝
-
-📦 PROJETO: {self.analysis.project_name}
-📁 Arquivos analisados: {self.analysis.files_analyzed}
-{metadata_section}
-{research_section}
-
-🔧 TECNOLOGIAS DETECTADAS ({len(self.analysis.technologies)}):
-{self._format_list(self.analysis.technologies)}
-{sources_section}
-
-📚 PAPERS RELEVANTES ENCONTRADOS:
+        # O relatório depende só da análise: reaproveitá-lo enquanto ela não mudar
+        if self._report_memo is not None and self._report_memo[0] is self.analysis:
+            report = self._report_memo[1]
+        else:
+            report = self._render_report()
+            self._report_memo = (self.analysis, report)
 
-{self._format_papers(papers)}
+        if output_path:
+            output_path.write_text(report, encoding="utf-8")
+            logger.info(f"💾 Relatório salvo em: {output_path}")
 
-💡 SUGESTÕES DE MELHORIA ({len(suggestions)}):
+        return report
 
-{self._format_list(suggestions, numbered=True)}
+    def _render_report(self) -> str:
+        """Monta o texto do relatório a partir da análise atual"""
+        papers = self.search_relevant_research()
+        suggestions = self.suggest_improvements()
 
-═══════════════════════════════════════════════════════════════
+        analysis = self.analysis
+        rule = "═" * 63
 
-🎯 PRÓXIMOS PASSOS:
-1. Revisar papers recomendados
-2. Implementar técnicas sugeridas
-3. Responder perguntas de pesquisa definidas
-4. Validar com métricas apropriadas
+        # Relatório montado linha a linha e unido com um único join no final
+        parts: list[str] = [
+            "",
+            "╔══════════════════════════════════════════════════════════════╗",
+            "║          🤖 AI RESEARCH ASSISTANT - REPORT                  ║",
+            "╚══════════════════════════════════════════════════════════════╝",
+            "",
+            f"📦 PROJETO: {analysis.project_name}",
+            f"📁 Arquivos analisados: {analysis.files_analyzed}",
+        ]
 
-═══════════════════════════════════════════════════════════════
-        """
+        # Seção de metadados
+        parts.append("")
+        if analysis.metadata:
+            m = analysis.metadata
+            parts.append("📦 METADADOS DO PROJETO:")
+            parts.append(f"   • Nome: {m.name}")
+            parts.append(f"   • Versão: {m.version or 'N/A'}")
+            parts.append(f"   • Keywords: {', '.join(m.keywords) if m.keywords else 'Nenhuma'}")
+            parts.append(f"   • Dependências: {len(m.dependencies)} principais")
 
-        if output_path:
-            output_path.write_text(report, encoding="utf-8")
-            print(f"💾 Relatório salvo em: {output_path}")
+        # Seção de research metadata (NOVO!)
+        parts.append("")
+        if analysis.research_metadata:
+            rm = analysis.research_metadata
+            focus = ", ".join(rm.research_focus) if rm.research_focus else "N/A"
+            parts.append("🔬 METADADOS DE PESQUISA (README):")
+            parts.append(f"   • Research Focus: {focus}")
+            parts.append(f"   • Keywords: {', '.join(rm.keywords[:5]) if rm.keywords else 'N/A'}")
+            parts.append(f"   • Perguntas: {len(rm.research_questions)} questões de pesquisa")
+            parts.append(f"   • Objetivos: {len(rm.goals)} objetivos definidos")
+            parts.append(f"   • Metodologia: {len(rm.methodology)} etapas")
+
+        parts.append("")
+        parts.append(f"🔧 TECNOLOGIAS DETECTADAS ({len(analysis.technologies)}):")
+        parts.append(self._format_list(analysis.technologies))
 
-        return report
+        # Seção de fontes de detecção (NOVO!)
+        if analysis.detection_sources:
+            parts.append("")
+            parts.append("🔍 FONTES DE DETECÇÃO:")
+            for tech, sources in list(analysis.detection_sources.items())[:5]:
+                parts.append(f"   • {tech}: {', '.join(sources)}")
+        parts.append("")
+
+        parts.append("")
+        parts.append("📚 PAPERS RELEVANTES ENCONTRADOS:")
+        parts.append("")
+        parts.append(self._format_papers(papers))
+        parts.append("")
+        parts.append(f"💡 SUGESTÕES DE MELHORIA ({len(suggestions)}):")
+        parts.append("")
+        parts.append(self._format_list(suggestions, numbered=True))
+        parts.append("")
+        parts.append(rule)
+        parts.append("")
+        parts.append("🎯 PRÓXIMOS PASSOS:")
+        parts.append("1. Revisar papers recomendados")
+        parts.append("2. Implementar técnicas sugeridas")
+        parts.append("3. Responder perguntas de pesquisa definidas")
+        parts.append("4. Validar com métricas apropriadas")
+        parts.append("")
+        parts.append(rule)
+        parts.append("        ")
+
+        return "\n".join(parts)
 
     @staticmethod
-    def _format_list(items: list[str], numbered: bool = False) -> str:
+    def _format_list(items: Sequence[str], numbered: bool = False) -> str:
         """Formata lista para o relatório"""
         if not items:
             return "   (nenhum item)"
@@ -666,21 +1161,21 @@ class AIResearchAssistant:
 
         formatted = []
         for i, paper in enumerate(papers, 1):
-            formatted.append(
-                f"""
-   {i}. {paper.title}
-      Autores: {", ".join(paper.authors[:3])}
-      Keywords: {", ".join(paper.keywords[:5])}
-      URL: {paper.url}
-      Upvotes: {paper.upvotes}
-            """.strip()
-            )
+            if i > 1:
+                formatted.append("")
+            formatted.append(f"{i}. {paper.title}")
+            formatted.append(f"      Autores: {', '.join(paper.authors[:3])}")
+            formatted.append(f"      Keywords: {', '.join(paper.keywords[:5])}")
+            formatted.append(f"      URL: {paper.url}")
+            formatted.append(f"      Upvotes: {paper.upvotes}")
 
-        return "\n\n".join(formatted)
+        return "\n".join(formatted)
 
 
 def main():
     """Função principal."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     print("""
     ╔════════════════════════════════════════╗
     ║   🚀 AI Research Assistant v1.0       ║
@@ -693,7 +1188,7 @@ def main():
     else:
         project_path = Path.cwd()
 
-    assistant = AIResearchAssistant(project_path)
+    assistant = AIResearchAssistant(project_path, cache_dir=_default_cache_dir(), verbose=True)
 
     print("\n🔄 Iniciando análise...\n")
     assistant.analyze_project()
@@ -701,8 +1196,14 @@ def main():
     report = assistant.generate_report()
     print(report)
 
+    # Mesmo texto já impresso: gravado direto, sem gerar o relatório de novo
     output_file = project_path / "ai_research_report.txt"
-    assistant.generate_report(output_file)
+    output_file.write_text(report, encoding="utf-8")
+    print(f"💾 Relatório salvo em: {output_file}")
+
+    stats = ReadmeParser.cache_stats
+    if stats:
+        print(f"🗄️  Cache do README: {stats['hits']} acerto(s), {stats['misses']} falta(s)")
 
     print("\n✅ Análise concluída com sucesso!")
 
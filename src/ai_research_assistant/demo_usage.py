@@ -4,12 +4,28 @@
 Exemplo de uso real com seu projeto gamma-pd-analytics
 """
 
+from typing import Any
 
 # ============================================================================
 # EXEMPLO 1: Análise do Projeto gamma-pd-analytics
 # ============================================================================
 
 
+# Projeto simulado exibido na demo 1
+_PROJECT_INFO: dict[str, Any] = {
+    "name": "gamma-pd-analytics",
+    "files_analyzed": 15,
+    "python_version": "3.12/3.13",
+    "technologies": ["NumPy", "Pandas", "Matplotlib", "SciPy", "Pydantic"],
+    "key_modules": [
+        "partial_discharge_analysis.py",
+        "read_soma_data.py",
+        "time_recover.py",
+        "linear_fit.py",
+    ],
+}
+
+
 def demo_analyze_gamma_pd():
     """Demonstra análise do projeto de partial discharge"""
 
@@ -19,29 +35,15 @@ def demo_analyze_gamma_pd():
     ═══════════════════════════════════════════════════════════
     """)
 
-    # Simular análise do projeto
-    project_info = {
-        "name": "gamma-pd-analytics",
-        "files_analyzed": 15,
-        "python_version": "3.12/3.13",
-        "technologies": ["NumPy", "Pandas", "Matplotlib", "SciPy", "Pydantic"],
-        "key_modules": [
-            "partial_discharge_analysis.py",
-            "read_soma_data.py",
-            "time_recover.py",
-            "linear_fit.py",
-        ],
-    }
-
-    print("📦 Projeto:", project_info["name"])
-    print("📁 Arquivos Python:", project_info["files_analyzed"])
-    print("🐍 Python:", project_info["python_version"])
+    print("📦 Projeto:", _PROJECT_INFO["name"])
+    print("📁 Arquivos Python:", _PROJECT_INFO["files_analyzed"])
+    print("🐍 Python:", _PROJECT_INFO["python_version"])
     print("\n🔧 Tecnologias detectadas:")
-    for tech in project_info["technologies"]:
+    for tech in _PROJECT_INFO["technologies"]:
         print(f"   ✓ {tech}")
 
     print("\n📝 Módulos principais:")
-    for module in project_info["key_modules"]:
+    for module in _PROJECT_INFO["key_modules"]:
         print(f"   • {module}")
 
 
@@ -50,22 +52,13 @@ def demo_analyze_gamma_pd():
 # ============================================================================
 
 
-def demo_ml_recommendations():
-    """Demonstra recomendações de ML/DL baseadas em research"""
-
-    print("""
-
-    ═══════════════════════════════════════════════════════════
-    🧠 DEMO 2: Recomendações de ML/DL
-    ═══════════════════════════════════════════════════════════
-    """)
-
-    recommendations = [
-        {
-            "technique": "Random Forest Classifier",
-            "accuracy": "86.82%",
-            "source": "Paper: Benchmarking ML for Fault Detection",
-            "implementation": """
+# Técnicas recomendadas (com código de exemplo) exibidas na demo 2
+_RECOMMENDATIONS: tuple[dict[str, str], ...] = (
+    {
+        "technique": "Random Forest Classifier",
+        "accuracy": "86.82%",
+        "source": "Paper: Benchmarking ML for Fault Detection",
+        "implementation": """
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import train_test_split
 
@@ -84,12 +77,12 @@ rf_model.fit(X_train, y_train)
 accuracy = rf_model.score(X_test, y_test)
 print(f"Accuracy: {accuracy:.2%}")
             """.strip(),
-        },
-        {
-            "technique": "1D-CNN para Séries Temporais",
-            "accuracy": "86.30%",
-            "source": "Paper: DL for Power Transformer Faults",
-            "implementation": """
+    },
+    {
+        "technique": "1D-CNN para Séries Temporais",
+        "accuracy": "86.30%",
+        "source": "Paper: DL for Power Transformer Faults",
+        "implementation": """
 import tensorflow as tf
 from tensorflow.keras import layers, models
 
@@ -111,12 +104,12 @@ model.compile(
     metrics=['accuracy']
 )
             """.strip(),
-        },
-        {
-            "technique": "Transformer com Attention",
-            "accuracy": "99.81%-91.43%",
-            "source": "Paper: AI Transformers for Power Quality",
-            "implementation": """
+    },
+    {
+        "technique": "Transformer com Attention",
+        "accuracy": "99.81%-91.43%",
+        "source": "Paper: AI Transformers for Power Quality",
+        "implementation": """
 import torch
 import torch.nn as nn
 
@@ -137,10 +130,21 @@ class TransformerClassifier(nn.Module):
         x = self.transformer(x)
         return self.classifier(x.mean(dim=1))
             """.strip(),
-        },
-    ]
+    },
+)
 
-    for i, rec in enumerate(recommendations, 1):
+
+def demo_ml_recommendations():
+    """Demonstra recomendações de ML/DL baseadas em research"""
+
+    print("""
+
+    ═══════════════════════════════════════════════════════════
+    🧠 DEMO 2: Recomendações de ML/DL
+    ═══════════════════════════════════════════════════════════
+    """)
+
+    for i, rec in enumerate(_RECOMMENDATIONS, 1):
         print(f"\n{i}. {rec['technique']}")
         print(f"   📊 Accuracy: {rec['accuracy']}")
         print(f"   📚 Fonte: {rec['source']}")
@@ -156,63 +160,65 @@ class TransformerClassifier(nn.Module):
 # ============================================================================
 
 
-def demo_improvement_pipeline():
-    """Demonstra pipeline de melhorias para o projeto"""
-
-    print("""
-
-    ═══════════════════════════════════════════════════════════
-    🚀 DEMO 3: Pipeline de Melhorias Sugerido
-    ═══════════════════════════════════════════════════════════
-    """)
-
-    pipeline = [
-        (
-            "1️⃣ ",
-            "REFATORAÇÃO",
-            "Completado! ✅",
-            "Código organizado em funções modulares com type hints",
-        ),
-        ("2️⃣ ", "CORREÇÃO DE BUGS", "Completado! ✅", "Bug no time_recover.py corrigido"),
-        (
-            "3️⃣ ",
-            "FEATURE ENGINEERING",
-            "Próximo passo 🎯",
-            """• Extrair features estatísticas (média, std, skewness, kurtosis)
+# Etapas do pipeline de melhorias: (emoji, etapa, status, detalhes)
+_PIPELINE: tuple[tuple[str, str, str, str], ...] = (
+    (
+        "1️⃣ ",
+        "REFATORAÇÃO",
+        "Completado! ✅",
+        "Código organizado em funções modulares com type hints",
+    ),
+    ("2️⃣ ", "CORREÇÃO DE BUGS", "Completado! ✅", "Bug no time_recover.py corrigido"),
+    (
+        "3️⃣ ",
+        "FEATURE ENGINEERING",
+        "Próximo passo 🎯",
+        """• Extrair features estatísticas (média, std, skewness, kurtosis)
 • Calcular features no domínio da frequência (FFT)
 • Criar features de janela deslizante
 • Normalizar/padronizar dados""",
-        ),
-        (
-            "4️⃣ ",
-            "IMPLEMENTAR ML",
-            "Futuro 🔮",
-            """• Testar Random Forest (baseline)
+    ),
+    (
+        "4️⃣ ",
+        "IMPLEMENTAR ML",
+        "Futuro 🔮",
+        """• Testar Random Forest (baseline)
 • Implementar 1D-CNN para padrões temporais
 • Avaliar Transformer para dados complexos
 • Usar validação cruzada k-fold""",
-        ),
-        (
-            "5️⃣ ",
-            "OTIMIZAÇÃO",
-            "Futuro 🔮",
-            """• GridSearchCV para hiperparâmetros
+    ),
+    (
+        "5️⃣ ",
+        "OTIMIZAÇÃO",
+        "Futuro 🔮",
+        """• GridSearchCV para hiperparâmetros
 • Early stopping para DL
 • Ensemble de modelos
 • Feature selection""",
-        ),
-        (
-            "6️⃣ ",
-            "DEPLOYMENT",
-            "Futuro 🔮",
-            """• API REST com FastAPI
+    ),
+    (
+        "6️⃣ ",
+        "DEPLOYMENT",
+        "Futuro 🔮",
+        """• API REST com FastAPI
 • Dashboard com Streamlit/Plotly
 • Monitoring com Prometheus
 • CI/CD com GitHub Actions""",
-        ),
-    ]
+    ),
+)
 
-    for emoji, stage, status, details in pipeline:
+
+def demo_improvement_pipeline():
+    """Demonstra pipeline de melhorias para o projeto"""
+
+    print("""
+
+    ═══════════════════════════════════════════════════════════
+    🚀 DEMO 3: Pipeline de Melhorias Sugerido
+    ═══════════════════════════════════════════════════════════
+    """)
+
+    for emoji, stage, status, details in _PIPELINE:
         print(f"\n{emoji}{stage:.<50}{status:>20}")
         if isinstance(details, str) and "\n" in details:
             for line in details.split("\n"):
@@ -226,6 +232,17 @@ def demo_improvement_pipeline():
 # ============================================================================
 
 
+# Modelos comparados: (nome, accuracy, interpretabilidade, complexidade, recomendação)
+_MODELS: tuple[tuple[str, float, str, str, str], ...] = (
+    ("Random Forest", 86.82, "Alto", "Médio", "★★★★☆"),
+    ("XGBoost", 85.50, "Alto", "Médio", "★★★★☆"),
+    ("1D-CNN", 86.30, "Médio", "Alto", "★★★★★"),
+    ("LSTM", 84.20, "Médio", "Alto", "★★★☆☆"),
+    ("GRU", 83.80, "Médio", "Alto", "★★★☆☆"),
+    ("Transformer", 91.43, "Baixo", "Muito Alto", "★★★★★"),
+)
+
+
 def demo_model_comparison():
     """Demonstra comparação de diferentes abordagens"""
 
@@ -236,22 +253,13 @@ def demo_model_comparison():
     ═══════════════════════════════════════════════════════════
     """)
 
-    models = [
-        ("Random Forest", 86.82, "Alto", "Médio", "★★★★☆"),
-        ("XGBoost", 85.50, "Alto", "Médio", "★★★★☆"),
-        ("1D-CNN", 86.30, "Médio", "Alto", "★★★★★"),
-        ("LSTM", 84.20, "Médio", "Alto", "★★★☆☆"),
-        ("GRU", 83.80, "Médio", "Alto", "★★★☆☆"),
-        ("Transformer", 91.43, "Baixo", "Muito Alto", "★★★★★"),
-    ]
-
     print("\n" + "─" * 80)
     print(
         f"{'Modelo':<20} {'Accuracy':>10} {'Interpretab.':>15} {'Complexidade':>15} {'Recom.':>10}"
     )
     print("─" * 80)
 
-    for model, acc, interp, comp, rec in models:
+    for model, acc, interp, comp, rec in _MODELS:
         print(f"{model:<20} {acc:>9.2f}% {interp:>15} {comp:>15} {rec:>10}")
 
     print("─" * 80)
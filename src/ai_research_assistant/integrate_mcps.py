@@ -10,18 +10,116 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
+import os
+import re
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
+
+try:
+    # Encoder JSON nativo, instalado pelo extra opcional `speed`
+    import orjson
+except ImportError:
+    orjson = None
 
 # ============================================================================
 # MCP INTEGRATIONS
 # ============================================================================
 
+# Extensões (sem o ponto) tratadas como arquivos de dados na análise do filesystem
+_DATA_EXTENSIONS = frozenset({"csv", "json", "pkl", "npy"})
+
+# Linhas `import ...` / `from ...` sem espaços nas pontas (equivalente a
+# `line.strip().startswith(("import ", "from "))`), varridas nos bytes crus do
+# arquivo: só as linhas capturadas são decodificadas
+_IMPORT_LINE_RE = re.compile(rb"^[^\S\n]*((?:import|from) [^\n]*?\S)[^\S\n]*$", re.MULTILINE)
+
+# Diretórios sem código nem dados do projeto (VCS, caches, ambientes virtuais,
+# artefatos de build); diretórios ocultos também são podados na travessia
+_SKIP_DIRS = frozenset(
+    {
+        ".git",
+        "__pycache__",
+        ".venv",
+        "venv",
+        "node_modules",
+        "build",
+        "dist",
+        ".tox",
+        ".mypy_cache",
+        ".pytest_cache",
+        "site-packages",
+    }
+)
+
+# Workers das leituras de arquivos: I/O-bound, então bem acima do número de CPUs
+_READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+# Moldura do sumário impresso por `MCPIntegrator.print_summary`
+_SUMMARY_HEADER = """
+╔══════════════════════════════════════════════════════════════╗
+║           📊 RESUMO DA ANÁLISE MCP                           ║
+╚══════════════════════════════════════════════════════════════╝
+
+"""
+_SUMMARY_FOOTER = """
+═══════════════════════════════════════════════════════════════
+
+"""
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Converte os tipos não-JSON que aparecem nos resultados (sets e caminhos).
+
+    Qualquer outro tipo levanta TypeError, em vez de virar `str(obj)` em silêncio.
+    """
+    if isinstance(obj, set | frozenset):
+        return sorted(obj)
+    if isinstance(obj, os.PathLike):
+        return os.fspath(obj)
+    raise TypeError(f"Tipo não serializável em JSON: {type(obj).__name__}")
+
 
-@dataclass
+def _scan_python_source(content: bytes) -> tuple[int, frozenset[str]]:
+    """Conta linhas e extrai imports direto dos bytes, sem decodificar o arquivo"""
+    imports = frozenset(
+        m.group(1).decode("utf-8", "ignore") for m in _IMPORT_LINE_RE.finditer(content)
+    )
+    return content.count(b"\n"), imports
+
+
+def _walk_files(root: str) -> Iterator[os.DirEntry[str]]:
+    """
+    Percorre `root` recursivamente com os.scandir e gera as entradas de arquivos.
+
+    As entradas do scandir já trazem o tipo (sem um stat extra por arquivo, como no
+    `Path.rglob`); symlinks de diretórios não são seguidos e `_SKIP_DIRS` e
+    diretórios ocultos não são visitados. Diretórios inexistentes ou ilegíveis são
+    pulados, como faz `Path.rglob`.
+    """
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SKIP_DIRS and not entry.name.startswith("."):
+                        stack.append(entry.path)
+                else:
+                    yield entry
+
+
+@dataclass(slots=True)
 class MCPConfig:
     """Configuração dos MCPs disponíveis"""
 
@@ -34,6 +132,8 @@ class MCPConfig:
 class MCPIntegrator:
     """Integra múltiplos MCPs em workflows"""
 
+    __slots__ = ("config", "results")
+
     def __init__(self, config: MCPConfig | None = None):
         self.config = config or MCPConfig()
         self.results = {}
@@ -77,34 +177,36 @@ class MCPIntegrator:
             "data_files": [],
             "config_files": [],
             "total_lines": 0,
-            "imports": set(),
+            "imports": [],
         }
 
-        # Encontrar arquivos Python
-        for py_file in project_path.rglob("*.py"):
-            try:
-                content = py_file.read_text(encoding="utf-8", errors="ignore")
-                lines = content.count("\n")
-                analysis["python_files"].append(
-                    {
-                        "name": py_file.name,
-                        "path": str(py_file.relative_to(project_path)),
-                        "lines": lines,
-                    }
-                )
-                analysis["total_lines"] += lines
-
-                # Extrair imports
-                for line in content.split("\n"):
-                    if line.strip().startswith(("import ", "from ")):
-                        analysis["imports"].add(line.strip())
-            except Exception as e:
-                print(f"      ⚠️  Erro lendo {py_file}: {e}")
+        # Uma única travessia (os.scandir) classifica arquivos Python e de dados
+        root = str(project_path)
+        py_files = []
+        for entry in _walk_files(root):
+            # rpartition em vez de os.path.splitext; como nele, ".csv" (dotfile) não tem extensão
+            stem, _, suffix = entry.name.rpartition(".")
+            if not stem.lstrip("."):
+                continue
+            if suffix == "py":
+                py_files.append(entry.path)
+            elif suffix in _DATA_EXTENSIONS:
+                analysis["data_files"].append(os.path.relpath(entry.path, root))
+
+        # Leituras em paralelo; os resultados são agregados aqui, na thread principal
+        # Conteúdos repetidos (stubs de __init__.py, cópias vendorizadas) são varridos uma vez
+        # Falhas de leitura são acumuladas e reportadas juntas no final
+        seen = {}
+        errors = []
+        with ThreadPoolExecutor(max_workers=_READ_WORKERS) as executor:
+            results = executor.map(
+                lambda f: self._read_python_file(f, root, seen, errors), py_files
+            )
+            results = [result for result in results if result is not None]
 
-        # Encontrar arquivos de dados
-        for data_ext in [".csv", ".json", ".pkl", ".npy"]:
-            for data_file in project_path.rglob(f"*{data_ext}"):
-                analysis["data_files"].append(str(data_file.relative_to(project_path)))
+        # Agregação de uma vez (sum e union rodam em C) em vez de acumular arquivo a arquivo
+        analysis["python_files"] = [file_info for file_info, _ in results]
+        analysis["total_lines"] = sum(file_info["lines"] for file_info in analysis["python_files"])
 
         # Encontrar arquivos de configuração
         for config_file in ["requirements.txt", "setup.py", "pyproject.toml", ".env"]:
@@ -112,14 +214,58 @@ class MCPIntegrator:
             if config_path.exists():
                 analysis["config_files"].append(config_file)
 
-        analysis["imports"] = sorted(list(analysis["imports"]))
+        # Imports já deduplicados por arquivo: uma união e uma ordenação no final
+        analysis["imports"] = sorted(set().union(*(imports for _, imports in results)))
 
         print(f"      ✓ {len(analysis['python_files'])} arquivos Python")
         print(f"      ✓ {len(analysis['data_files'])} arquivos de dados")
         print(f"      ✓ {analysis['total_lines']} linhas de código")
+        if errors:
+            print(f"      ⚠️  {len(errors)} arquivo(s) Python não lido(s):")
+            print("\n".join(f"         • {path}: {error}" for path, error in errors))
 
         return analysis
 
+    @staticmethod
+    def _read_python_file(
+        py_file: str,
+        root: str,
+        seen: dict[bytes, tuple[int, frozenset[str]]] | None = None,
+        errors: list[tuple[str, str]] | None = None,
+    ) -> tuple[dict[str, Any], frozenset[str]] | None:
+        """
+        Lê um arquivo Python e retorna (informações do arquivo, imports), ou None se falhar.
+
+        Com `seen`, (linhas, imports) ficam guardados pelo SHA-256 do conteúdo e são
+        reaproveitados para arquivos idênticos, sem repetir a varredura. Com `errors`,
+        falhas de leitura são acumuladas como (caminho, erro) em vez de impressas.
+        """
+        try:
+            with open(py_file, "rb") as f:
+                content = f.read()
+        except OSError as e:
+            if errors is None:
+                print(f"      ⚠️  Erro lendo {py_file}: {e}")
+            else:
+                errors.append((os.path.relpath(py_file, root), e.strerror or str(e)))
+            return None
+
+        if seen is None:
+            lines, imports = _scan_python_source(content)
+        else:
+            digest = hashlib.sha256(content).digest()
+            if (cached := seen.get(digest)) is None:
+                cached = seen[digest] = _scan_python_source(content)
+            lines, imports = cached
+
+        file_info = {
+            "name": os.path.basename(py_file),
+            "path": os.path.relpath(py_file, root),
+            "lines": lines,
+        }
+
+        return file_info, imports
+
     def _search_research_papers(self) -> dict[str, Any]:
         """Busca papers relevantes (simulado - integraria com HuggingFace MCP)"""
         print("   📚 Buscando papers relevantes...")
@@ -196,8 +342,14 @@ class MCPIntegrator:
         print(f"      ✓ {len(recommendations)} recomendações geradas")
         return recommendations
 
-    def export_report(self, output_path: Path | None = None):
-        """Exporta relatório em JSON"""
+    def export_report(
+        self, output_path: Path | None = None, format: Literal["json", "msgpack"] = "json"
+    ):
+        """
+        Exporta relatório em JSON (legível) ou msgpack (compacto, para ferramentas).
+
+        Em msgpack o arquivo recebe a extensão `.msgpack` e requer o extra `msgpack`.
+        """
         if not self.results:
             print("⚠️  Nenhum resultado para exportar")
             return
@@ -205,8 +357,24 @@ class MCPIntegrator:
         if output_path is None:
             output_path = Path("mcp_analysis_report.json")
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(self.results, f, indent=2, ensure_ascii=False, default=str)
+        if format == "msgpack":
+            try:
+                import ormsgpack  # Extra opcional `msgpack`, importado só quando pedido
+            except ImportError:
+                print("⚠️  Exportação msgpack requer o pacote ormsgpack: pip install ormsgpack")
+                return
+            output_path = output_path.with_suffix(".msgpack")
+            output_path.write_bytes(ormsgpack.packb(self.results, default=_json_default))
+        elif orjson is not None:
+            output_path.write_bytes(
+                orjson.dumps(self.results, default=_json_default, option=orjson.OPT_INDENT_2)
+            )
+        else:
+            # dumps + write: um tipo inválido não deixa um arquivo pela metade
+            output_path.write_text(
+                json.dumps(self.results, indent=2, ensure_ascii=False, default=_json_default),
+                encoding="utf-8",
+            )
 
         print(f"\n💾 Relatório exportado: {output_path}")
 
@@ -216,41 +384,28 @@ class MCPIntegrator:
             print("⚠️  Nenhum resultado disponível")
             return
 
-        print(f"""
-╔══════════════════════════════════════════════════════════════╗
-║           📊 RESUMO DA ANÁLISE MCP                           ║
-╚══════════════════════════════════════════════════════════════╝
-
-🎯 PROJETO: {self.results.get("project_name", "N/A")}
-
-📁 ANÁLISE DE CÓDIGO:
-""")
-
         analysis = self.results.get("analysis", {})
-        print(f"   • Arquivos Python: {len(analysis.get('python_files', []))}")
-        print(f"   • Linhas de código: {analysis.get('total_lines', 0)}")
-        print(f"   • Arquivos de dados: {len(analysis.get('data_files', []))}")
-        print(f"   • Imports únicos: {len(analysis.get('imports', []))}")
-
         research = self.results.get("research", {})
-        print(f"""
-📚 RESEARCH:
-   • Papers encontrados: {len(research.get("results", []))}
-""")
-
         recommendations = self.results.get("recommendations", [])
-        print(f"""
-💡 RECOMENDAÇÕES ({len(recommendations)}):
-""")
-        for i, rec in enumerate(recommendations[:5], 1):
-            print(f"   {i}. {rec}")
-
-        if len(recommendations) > 5:
-            print(f"   ... e mais {len(recommendations) - 5} recomendações")
-
-        print("""
-═══════════════════════════════════════════════════════════════
-""")
+        n_recommendations = len(recommendations)
+
+        parts = [
+            _SUMMARY_HEADER,
+            f"🎯 PROJETO: {self.results.get('project_name', 'N/A')}\n\n📁 ANÁLISE DE CÓDIGO:\n\n",
+            f"   • Arquivos Python: {len(analysis.get('python_files', []))}\n",
+            f"   • Linhas de código: {analysis.get('total_lines', 0)}\n",
+            f"   • Arquivos de dados: {len(analysis.get('data_files', []))}\n",
+            f"   • Imports únicos: {len(analysis.get('imports', []))}\n",
+            f"\n📚 RESEARCH:\n   • Papers encontrados: {len(research.get('results', []))}\n\n",
+            f"\n💡 RECOMENDAÇÕES ({n_recommendations}):\n\n",
+        ]
+        parts.extend(f"   {i}. {rec}\n" for i, rec in enumerate(recommendations[:5], 1))
+        if n_recommendations > 5:
+            parts.append(f"   ... e mais {n_recommendations - 5} recomendações\n")
+        parts.append(_SUMMARY_FOOTER)
+
+        # Um único write do sumário montado, em vez de um print por linha
+        sys.stdout.write("".join(parts))
 
 
 # ============================================================================
@@ -282,6 +437,13 @@ Exemplos:
 
     parser.add_argument("--output", type=Path, help="Arquivo de saída para relatório JSON")
 
+    parser.add_argument(
+        "--format",
+        choices=["json", "msgpack"],
+        default="json",
+        help="Formato do relatório exportado (padrão: json)",
+    )
+
     args = parser.parse_args()
 
     # Banner
@@ -307,10 +469,7 @@ Exemplos:
         integrator.analyze_partial_discharge_project(project_path)
         integrator.print_summary()
 
-        if args.output:
-            integrator.export_report(args.output)
-        else:
-            integrator.export_report()
+        integrator.export_report(args.output, format=args.format)
 
     elif args.research:
         print(f"🔍 Pesquisando sobre: {args.research}")
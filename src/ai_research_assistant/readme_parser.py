@@ -3,10 +3,48 @@
 Parser de README.md para extração de metadados de pesquisa
 """
 
+import functools
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
 import re
-from dataclasses import dataclass, field
+from collections import Counter
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
+# Headers H2/H3; o espaço após os "#" não atravessa a quebra de linha
+_HDR_RE = re.compile(r"^(#{2,3})[^\S\n]+(.+)$", re.MULTILINE)
+
+# Limpeza dos itens de uma seção
+# Marcadores opcionais em sequência: bullet, número e citação ("- 1. > x" -> "x")
+_LIST_MARKER_RE = re.compile(r"^(?:[-*+]\s+)?(?:\d+\.\s+)?(?:>\s+)?")
+_LINK_RE = re.compile(r"\[([^\]]+)\]\([^)]+\)")
+_CODE_RE = re.compile(r"`([^`]+)`")
+# Bold+italic, bold e italic numa única passada
+_EMPHASIS_RE = re.compile(r"\*\*\*([^*]+)\*\*\*|\*\*([^*]+)\*\*|\*([^*]+)\*")
+
+
+def _process_context() -> multiprocessing.context.BaseContext:
+    """
+    Contexto dos processos de `parse_many`: forkserver (ou spawn, onde não existe).
+
+    O chamador pode ter threads ativas (pools de leitura do assistente, um servidor
+    web), e um fork() a partir de um processo multi-thread pode travar o filho
+    com um lock herdado no estado "adquirido".
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+# Incrementar quando ResearchMetadata ou as regras de parsing mudarem,
+# invalidando os READMEs parseados que estão no cache em disco
+_CACHE_VERSION = 1
+
 
 @dataclass(slots=True)
 class ResearchMetadata:
@@ -22,6 +60,11 @@ class ResearchMetadata:
     datasets: list[str] = field(default_factory=list)
 
 
+def _emphasis_text(match: re.Match[str]) -> str:
+    """Texto do grupo de ênfase que casou (bold+italic, bold ou italic)"""
+    return match.group(match.lastindex)
+
+
 class ReadmeParser:
     """
     Parser inteligente de README.md que extrai informações estruturadas.
@@ -69,13 +112,18 @@ class ReadmeParser:
         "data": "datasets",
     }
 
+    # Acertos/faltas do cache em disco usado por `parse(..., cache_dir=...)`
+    cache_stats: Counter[str] = Counter()
+
     @classmethod
-    def parse(cls, readme_path: Path) -> ResearchMetadata | None:
+    def parse(cls, readme_path: Path, cache_dir: Path | None = None) -> ResearchMetadata | None:
         """
         Parse README.md e extrai metadados de pesquisa.
 
         Args:
             readme_path: Caminho para o README.md
+            cache_dir: Se informado, o resultado é persistido em JSON neste diretório,
+                com chave pelo hash do conteúdo, e reaproveitado enquanto ele não mudar
 
         Returns:
             ResearchMetadata com informações extraídas ou None
@@ -85,14 +133,78 @@ class ReadmeParser:
 
         try:
             content = readme_path.read_text(encoding="utf-8")
-            return cls._parse_content(content)
         except Exception as e:
             print(f"⚠️  Erro ao ler README.md: {e}")
             return None
 
+        if cache_dir is None:
+            return cls.parse_text(content)
+
+        key = hashlib.blake2b(f"{_CACHE_VERSION}\0{content}".encode(), digest_size=16).hexdigest()
+        cache_path = cache_dir / f"readme-{key}.json"
+
+        try:
+            metadata = ResearchMetadata(**json.loads(cache_path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, TypeError):
+            # Ausente ou ilegível: parsear e (tentar) gravar
+            cls.cache_stats["misses"] += 1
+        else:
+            cls.cache_stats["hits"] += 1
+            return metadata
+
+        metadata = cls.parse_text(content)
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps(asdict(metadata)), encoding="utf-8")
+        except OSError as e:
+            print(f"⚠️  Não foi possível gravar o cache do README: {e}")
+        return metadata
+
     @classmethod
-    def _parse_content(cls, content: str) -> ResearchMetadata:
-        """Parse do conteúdo do README"""
+    def parse_many(
+        cls,
+        readme_paths: Iterable[Path],
+        workers: int | None = None,
+        cache_dir: Path | None = None,
+    ) -> dict[Path, ResearchMetadata | None]:
+        """
+        Parse de vários README.md (ex.: subprojetos de um monorepo) em paralelo.
+
+        O parsing é CPU-bound, então usa processos. Os contadores de `cache_stats`
+        dos processos filhos não são somados aos do processo atual.
+
+        Args:
+            readme_paths: Caminhos dos README.md
+            workers: Número de processos (padrão: número de CPUs)
+            cache_dir: Repassado a `parse` em cada processo
+
+        Returns:
+            Dict caminho -> ResearchMetadata (ou None), na ordem de entrada
+        """
+        readme_paths = list(readme_paths)
+        workers = min(workers or os.cpu_count() or 1, len(readme_paths))
+        parse = functools.partial(cls.parse, cache_dir=cache_dir)
+
+        # Poucos arquivos não compensam o custo de subir os processos
+        if workers <= 1:
+            return {path: parse(path) for path in readme_paths}
+
+        chunksize = max(1, len(readme_paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_process_context()) as executor:
+            results = executor.map(parse, readme_paths, chunksize=chunksize)
+            return dict(zip(readme_paths, results, strict=True))
+
+    @classmethod
+    def parse_text(cls, content: str) -> ResearchMetadata:
+        """
+        Parse do conteúdo de um README já em memória.
+
+        Args:
+            content: Texto markdown do README
+
+        Returns:
+            ResearchMetadata com informações extraídas
+        """
         metadata = ResearchMetadata()
 
         # Dividir por seções (headers H2 e H3)
@@ -108,27 +220,18 @@ class ReadmeParser:
     def _extract_sections(cls, content: str) -> dict[str, str]:
         """Extrai seções do markdown (## e ###)"""
         sections = {}
-        current_header = None
-        current_content = []
-
-        for line in content.split("\n"):
-            # Detectar headers
-            header_match = re.match(r"^(#{2,3})\s+(.+)$", line)
-
-            if header_match:
-                # Salvar seção anterior
-                if current_header:
-                    sections[current_header] = "\n".join(current_content).strip()
+        headers = list(_HDR_RE.finditer(content))
+        if not headers:
+            return sections
 
-                # Iniciar nova seção
-                current_header = header_match.group(2).strip()
-                current_content = []
-            elif current_header:
-                current_content.append(line)
+        # Cada seção é o trecho entre o fim do seu header e o início do próximo
+        ends = [match.start() for match in headers[1:]]
+        ends.append(len(content))
 
-        # Salvar última seção
-        if current_header:
-            sections[current_header] = "\n".join(current_content).strip()
+        for match, end in zip(headers, ends, strict=True):
+            header = match.group(2).strip()
+            if header:
+                sections[header] = content[match.end() : end].strip()
 
         return sections
 
@@ -137,12 +240,14 @@ class ReadmeParser:
         """Processa uma seção específica"""
         header_lower = header.lower()
 
-        # Encontrar qual campo corresponde a este header
-        field_name = None
-        for section_key, field in cls.SECTION_MAPPING.items():
-            if section_key in header_lower:
-                field_name = field
-                break
+        # Encontrar qual campo corresponde a este header: header exato primeiro,
+        # senão a primeira chave (na ordem do mapeamento) contida nele
+        field_name = cls.SECTION_MAPPING.get(header_lower)
+        if field_name is None:
+            for section_key, field in cls.SECTION_MAPPING.items():
+                if section_key in header_lower:
+                    field_name = field
+                    break
 
         if not field_name:
             return
@@ -159,26 +264,23 @@ class ReadmeParser:
         """Extrai itens de uma seção (bullets, números, ou linhas)"""
         items = []
 
-        for line in content.split("\n"):
+        for line in content.splitlines():
             line = line.strip()
 
             if not line:
                 continue
 
-            # Remover marcadores de lista
-            line = re.sub(r"^[-*+]\s+", "", line)  # bullets
-            line = re.sub(r"^\d+\.\s+", "", line)  # numbered
-            line = re.sub(r"^>\s+", "", line)  # quotes
+            # Remover marcadores de lista (bullets, numbered, quotes)
+            line = _LIST_MARKER_RE.sub("", line, count=1)
 
             # Remover markdown links mas manter o texto
-            line = re.sub(r"\[([^\]]+)\]\([^\)]+\)", r"\1", line)
+            line = _LINK_RE.sub(r"\1", line)
 
             # Remover código inline
-            line = re.sub(r"`([^`]+)`", r"\1", line)
+            line = _CODE_RE.sub(r"\1", line)
 
             # Remover bold/italic
-            line = re.sub(r"\*\*([^\*]+)\*\*", r"\1", line)
-            line = re.sub(r"\*([^\*]+)\*", r"\1", line)
+            line = _EMPHASIS_RE.sub(_emphasis_text, line)
 
             line = line.strip()
 
@@ -195,42 +297,39 @@ class ReadmeParser:
         Combina research focus, questions, e keywords para criar
         queries efetivas para busca de papers.
         """
-        queries = []
-
-        # 1. Research Focus direto
-        queries.extend(metadata.research_focus)
-
-        # 2. Research Questions como queries
-        for question in metadata.research_questions:
-            # Remover pontuação de pergunta
-            query = question.rstrip("?").strip()
-            queries.append(query)
-
-        # 3. Combinar keywords principais
+        # 1. Research Focus direto + 2. Research Questions como queries
+        # (sem a pontuação de pergunta)
+        queries = [
+            *metadata.research_focus,
+            *(question.rstrip("?").strip() for question in metadata.research_questions),
+        ]
+
+        # 3. Combinar keywords principais (top 3)
         if len(metadata.keywords) >= 2:
-            # Pegar top 3 keywords e combinar
-            top_keywords = metadata.keywords[:3]
-            combined = " ".join(top_keywords)
-            queries.append(combined)
+            queries.append(" ".join(metadata.keywords[:3]))
 
-        # 4. Metodologia + Focus
-        if metadata.methodology and metadata.research_focus:
-            for method in metadata.methodology[:2]:
-                for focus in metadata.research_focus[:2]:
-                    queries.append(f"{method} {focus}")
+        # 4. Metodologia + Focus (produto vazio se faltar um dos lados)
+        queries.extend(
+            f"{method} {focus}"
+            for method, focus in itertools.product(
+                metadata.methodology[:2], metadata.research_focus[:2]
+            )
+        )
 
         return queries
 
 
-def create_research_readme_template(output_path: Path, project_name: str = "Your Project"):
+def render_research_readme_template(project_name: str = "Your Project") -> str:
     """
-    Cria um template de README.md estruturado para pesquisa.
+    Gera o texto do template de README.md estruturado para pesquisa.
 
     Args:
-        output_path: Onde salvar o template
         project_name: Nome do projeto
+
+    Returns:
+        Markdown do template
     """
-    template = f"""# {project_name}
+    return f"""# {project_name}
 
 > Brief description of your research project
 
@@ -308,7 +407,16 @@ Papers that influenced this work:
 The tool will automatically extract research metadata to find relevant papers and suggest improvements.
 """
 
-    output_path.write_text(template, encoding="utf-8")
+
+def create_research_readme_template(output_path: Path, project_name: str = "Your Project"):
+    """
+    Cria um template de README.md estruturado para pesquisa.
+
+    Args:
+        output_path: Onde salvar o template
+        project_name: Nome do projeto
+    """
+    output_path.write_text(render_research_readme_template(project_name), encoding="utf-8")
     print(f"✅ Template criado em: {output_path}")
 
 
@@ -55,6 +55,35 @@ def test_detect_technologies(tmp_path):
     assert isinstance(sources, dict)
 
 
+def test_match_technologies():
+    """Testa o casamento de várias chaves de tecnologia, inclusive sobrepostas"""
+    matched = AIResearchAssistant._match_technologies("pytorch + random forest + scipytest")
+
+    assert matched == {"PyTorch", "Random Forest", "SciPy", "pytest"}
+
+
+def test_match_technology_words():
+    """Testa o casamento por palavra inteira usado nas seções do README"""
+    matched = AIResearchAssistant._match_technology_words(
+        "numpy-based lstm with random forest and scikit-learn; not cnns nor pytorchlike"
+    )
+
+    assert matched == {"NumPy", "LSTM Networks", "Random Forest", "Scikit-learn"}
+
+
+def test_lookup_technologies_exact_hit_matches_substring_scan():
+    """Testa que o atalho por chave exata dá o mesmo resultado da busca por substring"""
+    from ai_research_assistant.ai_research_assistant import _TECH_MAPPING
+
+    for key in _TECH_MAPPING:
+        assert set(AIResearchAssistant._lookup_technologies(key)) == (
+            AIResearchAssistant._match_technologies(key)
+        )
+    assert set(AIResearchAssistant._lookup_technologies("machine-learning with torch")) == {
+        "PyTorch"
+    }
+
+
 def test_analyze_project(tmp_path):
     """Testa análise de projeto"""
     # Criar alguns arquivos Python
@@ -69,6 +98,142 @@ def test_analyze_project(tmp_path):
     assert len(analysis.technologies) > 0
 
 
+def test_analyze_project_skips_vendored_dirs(tmp_path):
+    """Testa que .venv, .git, build, diretórios ocultos etc. não entram na análise"""
+    (tmp_path / "main.py").write_text("import numpy\n")
+    for skipped in (".venv/lib", ".git", "node_modules/pkg", "venv/lib", "build/lib", ".hidden"):
+        (tmp_path / skipped).mkdir(parents=True)
+        (tmp_path / skipped / "vendored.py").write_text("import django\n")
+
+    assistant = AIResearchAssistant(tmp_path)
+    analysis = assistant.analyze_project()
+
+    assert analysis.files_analyzed == 1
+    assert "Django" not in analysis.technologies
+
+
+def test_analyze_project_uses_disk_cache(tmp_path):
+    """Testa que a análise é reaproveitada do cache enquanto o projeto não muda"""
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "main.py").write_text("import numpy\n")
+    (project / "README.md").write_text("## Keywords\n- time series\n")
+    cache_dir = tmp_path / "cache"
+
+    first = AIResearchAssistant(project, cache_dir=cache_dir).analyze_project()
+    assert len(list(cache_dir.glob("*.json"))) == 1
+
+    second = AIResearchAssistant(project, cache_dir=cache_dir).analyze_project()
+    assert second == first
+
+    (project / "extra.py").write_text("import pandas\n")
+    third = AIResearchAssistant(project, cache_dir=cache_dir).analyze_project()
+    assert third.files_analyzed == 2
+    assert "Pandas" in third.technologies
+
+
+def test_analyze_missing_project_with_cache(tmp_path):
+    """Testa que um projeto inexistente é analisado (vazio) mesmo com cache ativo"""
+    missing = tmp_path / "missing"
+
+    analysis = AIResearchAssistant(missing, cache_dir=tmp_path / "cache").analyze_project()
+
+    assert analysis.project_name == "missing"
+    assert analysis.files_analyzed == 0
+
+
+def test_default_cache_dir_without_home(monkeypatch):
+    """Testa que, sem diretório home resolvível, a CLI segue sem cache"""
+    from ai_research_assistant import ai_research_assistant as module
+
+    def no_home():
+        raise RuntimeError("Could not determine home directory.")
+
+    monkeypatch.setattr(module.Path, "home", no_home)
+
+    assert module._default_cache_dir() is None
+
+
+def test_extract_imports(tmp_path):
+    """Testa extração de imports únicos do código"""
+    (tmp_path / "a.py").write_text("import numpy as np\nfrom pathlib import Path  \n")
+    (tmp_path / "b.py").write_text("def f():\n    import numpy as np\n# import ignorado\n")
+
+    assistant = AIResearchAssistant(tmp_path)
+    imports = assistant._extract_imports()
+
+    assert imports == ["from pathlib import Path", "import numpy as np"]
+
+
+def test_extract_imports_multiline_and_fallback(tmp_path):
+    """Testa imports em várias linhas, texto em docstring e arquivo inválido"""
+    (tmp_path / "a.py").write_text(
+        '"""\nimport os\n"""\nfrom typing import (\n    Any,\n    Protocol,\n)\n'
+    )
+    (tmp_path / "broken.py").write_text("import json\ndef f(:\n")
+
+    assistant = AIResearchAssistant(tmp_path)
+    imports = assistant._extract_imports()
+
+    assert imports == ["from typing import Any, Protocol", "import json"]
+
+
+def test_scan_file_skips_keys_already_found(tmp_path):
+    """Testa que chaves já encontradas não são procuradas de novo"""
+    py_file = tmp_path / "m.py"
+    py_file.write_text("import numpy\nimport pandas\n")
+
+    found = {"numpy"}
+    scan = AIResearchAssistant._scan_file(str(py_file), found=found)
+
+    assert scan.technologies == {"Pandas"}
+    assert scan.imports == {"import numpy", "import pandas"}
+    assert found == {"numpy", "pandas"}
+
+
+def test_unreadable_source_file_does_not_discard_scan(tmp_path):
+    """Testa que um .py ilegível não descarta a varredura dos demais arquivos"""
+    (tmp_path / "main.py").write_text("import numpy\nimport pandas\n")
+    (tmp_path / "z").mkdir()
+    (tmp_path / "z" / "broken.py").symlink_to(tmp_path / "missing.py")
+
+    analysis = AIResearchAssistant(tmp_path).analyze_project()
+
+    assert analysis.files_analyzed == 2
+    assert "NumPy" in analysis.technologies
+    assert "Pandas" in analysis.technologies
+    assert "import numpy" in analysis.imports
+
+
+def test_oversized_source_files_are_skipped(tmp_path, monkeypatch):
+    """Testa que arquivos acima do limite de tamanho não são lidos"""
+    from ai_research_assistant import ai_research_assistant as module
+
+    monkeypatch.setattr(module, "_MAX_SOURCE_BYTES", 64)
+    (tmp_path / "small.py").write_text("import numpy\n")
+    (tmp_path / "generated.py").write_text("import pandas\n" + "x = 1\n" * 20)
+
+    analysis = AIResearchAssistant(tmp_path).analyze_project()
+
+    assert analysis.technologies == ("NumPy",)
+    assert analysis.imports == ("import numpy",)
+    # Arquivos ignorados por tamanho não contam como analisados
+    assert analysis.files_analyzed == 1
+
+
+def test_analysis_reuses_loaded_sources(tmp_path):
+    """Testa que detecção e imports trabalham sobre a varredura já feita"""
+    (tmp_path / "a.py").write_text("import pandas as pd\n")
+
+    assistant = AIResearchAssistant(tmp_path)
+    scans = assistant._scan_sources()
+    (tmp_path / "a.py").unlink()  # o disco não é mais consultado
+
+    technologies, _ = assistant._detect_technologies(None, None, scans)
+    assert technologies == ["Pandas"]
+    assert assistant._extract_imports(scans) == ["import pandas as pd"]
+
+
 def test_search_relevant_research(tmp_path):
     """Testa busca de papers"""
     assistant = AIResearchAssistant(tmp_path)
@@ -89,6 +254,23 @@ def test_suggest_improvements_without_analysis(tmp_path):
         assistant.suggest_improvements()
 
 
+def test_suggestions_are_cached_until_new_analysis(tmp_path):
+    """Testa que sugestões são memorizadas e recalculadas após nova análise"""
+    (tmp_path / "test.py").write_text("import numpy\n")
+
+    assistant = AIResearchAssistant(tmp_path)
+    assistant.analyze_project()
+    first = assistant.suggest_improvements()
+    first.clear()  # a cópia devolvida não afeta o cache
+
+    assert assistant.improvement_suggestions is assistant.improvement_suggestions
+    assert not any("Pandas" in s for s in assistant.suggest_improvements())
+
+    (tmp_path / "other.py").write_text("import pandas\n")
+    assistant.analyze_project()
+    assert any("Pandas" in s for s in assistant.suggest_improvements())
+
+
 def test_suggest_improvements_with_analysis(tmp_path):
     """Testa geração de sugestões"""
     # Criar arquivo com NumPy
@@ -127,3 +309,18 @@ def test_generate_report_with_output_file(tmp_path):
     assert output_file.exists()
     content = output_file.read_text()
     assert "AI RESEARCH ASSISTANT" in content
+
+
+def test_generate_report_is_memoized_per_analysis(tmp_path):
+    """Testa que o relatório é reaproveitado até a próxima análise"""
+    (tmp_path / "test.py").write_text("import numpy\n")
+
+    assistant = AIResearchAssistant(tmp_path)
+    assistant.analyze_project()
+    first = assistant.generate_report()
+
+    assert assistant.generate_report(tmp_path / "report.txt") is first
+
+    (tmp_path / "other.py").write_text("import pandas\n")
+    assistant.analyze_project()
+    assert "Pandas" in assistant.generate_report()
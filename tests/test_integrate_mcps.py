@@ -0,0 +1,155 @@
+"""
+Testes para o integrador de MCPs
+"""
+
+import json
+import os
+
+import pytest
+
+from ai_research_assistant.integrate_mcps import MCPIntegrator
+
+
+def test_analyze_filesystem(tmp_path):
+    """Testa a classificação de arquivos Python e de dados numa única travessia"""
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "main.py").write_text("import numpy as np\nfrom pathlib import Path\n")
+    (tmp_path / "pkg" / "util.py").write_text("import numpy as np\n\nx = 1\n")
+    (tmp_path / "pkg" / "data.csv").write_text("a,b\n")
+    (tmp_path / "arrays.npy").write_bytes(b"")
+    (tmp_path / "notes.txt").write_text("import os\n")
+    (tmp_path / ".json").write_text("{}")
+    (tmp_path / "json").write_text("{}")
+    (tmp_path / "requirements.txt").write_text("numpy\n")
+    for skipped in (".git", "node_modules", ".venv/lib", "__pycache__"):
+        (tmp_path / skipped).mkdir(parents=True)
+        (tmp_path / skipped / "vendored.py").write_text("import requests\n")
+        (tmp_path / skipped / "blob.json").write_text("{}")
+
+    analysis = MCPIntegrator()._analyze_filesystem(tmp_path)
+
+    assert sorted(f["path"] for f in analysis["python_files"]) == ["main.py", "pkg/util.py"]
+    assert analysis["total_lines"] == 5
+    assert sorted(analysis["data_files"]) == ["arrays.npy", "pkg/data.csv"]
+    assert analysis["config_files"] == ["requirements.txt"]
+    assert analysis["imports"] == ["from pathlib import Path", "import numpy as np"]
+
+
+def test_analyze_filesystem_missing_directory(tmp_path):
+    """Testa que um diretório inexistente resulta numa análise vazia"""
+    analysis = MCPIntegrator()._analyze_filesystem(tmp_path / "does-not-exist")
+
+    assert analysis["python_files"] == []
+    assert analysis["data_files"] == []
+    assert analysis["total_lines"] == 0
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "geteuid") or os.geteuid() == 0,
+    reason="root ignora permissões de diretório",
+)
+def test_analyze_filesystem_skips_unreadable_directory(tmp_path):
+    """Testa que um diretório sem permissão de leitura é pulado"""
+    (tmp_path / "main.py").write_text("import os\n")
+    locked = tmp_path / "locked"
+    locked.mkdir()
+    (locked / "hidden.py").write_text("import sys\n")
+    locked.chmod(0)
+    try:
+        analysis = MCPIntegrator()._analyze_filesystem(tmp_path)
+    finally:
+        locked.chmod(0o755)
+
+    assert [f["path"] for f in analysis["python_files"]] == ["main.py"]
+
+
+def test_read_python_file_imports(tmp_path):
+    """Testa a extração de imports (indentados, com espaços nas pontas, falsos positivos)"""
+    py_file = tmp_path / "mod.py"
+    py_file.write_text(
+        "import os  \n"
+        "def f():\n"
+        "\tfrom json import loads\n"
+        "important = 1\n"
+        "import \n"
+        "# import ignorado\n"
+    )
+
+    file_info, imports = MCPIntegrator._read_python_file(str(py_file), str(tmp_path))
+
+    assert file_info == {"name": "mod.py", "path": "mod.py", "lines": 6}
+    assert imports == {"import os", "from json import loads"}
+
+
+def test_read_python_file_empty_and_non_utf8(tmp_path):
+    """Testa arquivos vazios e bytes inválidos fora das linhas de import"""
+    (tmp_path / "empty.py").write_bytes(b"")
+    (tmp_path / "latin.py").write_bytes(b"# caf\xe9\nimport os\n")
+
+    assert MCPIntegrator._read_python_file(str(tmp_path / "empty.py"), str(tmp_path)) == (
+        {"name": "empty.py", "path": "empty.py", "lines": 0},
+        set(),
+    )
+    _, imports = MCPIntegrator._read_python_file(str(tmp_path / "latin.py"), str(tmp_path))
+    assert imports == {"import os"}
+
+
+def test_read_python_file_reuses_duplicate_content(tmp_path):
+    """Testa que arquivos com conteúdo idêntico são varridos uma única vez"""
+    for name in ("a.py", "b.py"):
+        (tmp_path / name).write_text("import os\n")
+    seen = {}
+
+    first = MCPIntegrator._read_python_file(str(tmp_path / "a.py"), str(tmp_path), seen)
+    second = MCPIntegrator._read_python_file(str(tmp_path / "b.py"), str(tmp_path), seen)
+
+    assert len(seen) == 1
+    assert first[0]["path"] == "a.py"
+    assert second[0]["path"] == "b.py"
+    assert first[1] is second[1]
+
+
+def test_export_report(tmp_path):
+    """Testa exportação em JSON de sets e caminhos, rejeitando tipos desconhecidos"""
+    integrator = MCPIntegrator()
+    integrator.results = {"project_name": "pd", "imports": {"import os", "import json"}}
+    integrator.results["path"] = tmp_path
+    output_path = tmp_path / "report.json"
+
+    integrator.export_report(output_path)
+
+    assert json.loads(output_path.read_text(encoding="utf-8")) == {
+        "project_name": "pd",
+        "imports": ["import json", "import os"],
+        "path": str(tmp_path),
+    }
+
+    integrator.results["extra"] = object()
+    with pytest.raises(TypeError):
+        integrator.export_report(output_path)
+
+
+def test_export_report_msgpack(tmp_path):
+    """Testa exportação em msgpack (extra opcional)"""
+    ormsgpack = pytest.importorskip("ormsgpack")
+    integrator = MCPIntegrator()
+    integrator.results = {"project_name": "pd", "imports": {"import os"}}
+
+    integrator.export_report(tmp_path / "report.json", format="msgpack")
+
+    packed = (tmp_path / "report.msgpack").read_bytes()
+    assert ormsgpack.unpackb(packed) == {"project_name": "pd", "imports": ["import os"]}
+    assert not (tmp_path / "report.json").exists()
+
+
+def test_analyze_filesystem_reports_unreadable_files(tmp_path, capsys):
+    """Testa que falhas de leitura são acumuladas e reportadas juntas no final"""
+    (tmp_path / "ok.py").write_text("import os\n")
+    (tmp_path / "broken.py").symlink_to(tmp_path / "missing.py")
+
+    analysis = MCPIntegrator()._analyze_filesystem(tmp_path)
+
+    assert [f["path"] for f in analysis["python_files"]] == ["ok.py"]
+    output = capsys.readouterr().out
+    assert "1 arquivo(s) Python não lido(s)" in output
+    assert "• broken.py: No such file or directory" in output
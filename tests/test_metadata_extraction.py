@@ -2,11 +2,93 @@
 Testes para extração de metadados do projeto
 """
 
+import os
+from pathlib import Path
+
+import pytest
+
 from ai_research_assistant import (
     AIResearchAssistant,
+    ProjectMetadata,
     ProjectMetadataExtractor,
 )
 
+# ============================================================================
+# FIXTURES
+# ============================================================================
+# Projetos analisados uma única vez por módulo: os testes só leem a análise,
+# e as sugestões/papers já são memoizados pelo próprio assistente
+
+
+def _setup_project(
+    project_path: Path,
+    pyproject: str | None = None,
+    requirements: str | None = None,
+    setup_py: str | None = None,
+    py_files: dict[str, str] | None = None,
+) -> Path:
+    """Cria os arquivos informados (os omitidos não são criados) e retorna o diretório"""
+    files = {
+        "pyproject.toml": pyproject,
+        "requirements.txt": requirements,
+        "setup.py": setup_py,
+        **(py_files or {}),
+    }
+    for name, content in files.items():
+        if content is not None:
+            (project_path / name).write_text(content)
+    return project_path
+
+
+def _analyzed_assistant(
+    tmp_path_factory, name: str, pyproject_content: str, py_content: str | None = None
+):
+    """Cria o projeto (pyproject.toml e, se informado, test.py) e retorna o assistente analisado"""
+    py_files = None if py_content is None else {"test.py": py_content}
+    project_path = _setup_project(
+        tmp_path_factory.mktemp(name), pyproject=pyproject_content, py_files=py_files
+    )
+
+    assistant = AIResearchAssistant(project_path)
+    assistant.analyze_project()
+    return assistant
+
+
+@pytest.fixture(scope="module")
+def mcp_assistant(tmp_path_factory):
+    """Projeto MCP identificado só pelas keywords do pyproject.toml"""
+    return _analyzed_assistant(
+        tmp_path_factory,
+        "mcp_project",
+        """
+[project]
+name = "mcp-test"
+keywords = ["mcp", "Model Context Protocol"]
+dependencies = []
+""",
+    )
+
+
+@pytest.fixture(scope="module")
+def numpy_assistant(tmp_path_factory):
+    """Projeto com metadados completos, dependências numpy/pydantic e imports numpy/pandas"""
+    return _analyzed_assistant(
+        tmp_path_factory,
+        "numpy_project",
+        """
+[project]
+name = "meta-test"
+version = "2.0.0"
+description = "Test metadata"
+keywords = ["test"]
+dependencies = [
+    "numpy>=1.26.0",
+    "pydantic>=2.5.0",
+]
+""",
+        "import numpy as np\nimport pandas as pd\n",
+    )
+
 
 def test_extract_from_pyproject(tmp_path):
     """Testa extração de metadados do pyproject.toml"""
@@ -25,8 +107,7 @@ dependencies = [
 [project.optional-dependencies]
 dev = ["pytest>=7.4.0"]
 """
-    pyproject_path = tmp_path / "pyproject.toml"
-    pyproject_path.write_text(pyproject_content)
+    _setup_project(tmp_path, pyproject=pyproject_content)
 
     # Extrair metadados
     extractor = ProjectMetadataExtractor()
@@ -41,6 +122,21 @@ dev = ["pytest>=7.4.0"]
     assert len(metadata.dependencies) == 2
 
 
+def test_extract_from_pyproject_reparses_when_modified(tmp_path):
+    """Testa que o cache do pyproject.toml é invalidado quando o arquivo muda"""
+    pyproject_path = tmp_path / "pyproject.toml"
+    pyproject_path.write_text('[project]\nname = "before"\n')
+
+    extractor = ProjectMetadataExtractor()
+    assert extractor.extract_from_pyproject(tmp_path).name == "before"
+
+    pyproject_path.write_text('[project]\nname = "after"\n')
+    mtime_ns = pyproject_path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(pyproject_path, ns=(mtime_ns, mtime_ns))
+
+    assert extractor.extract_from_pyproject(tmp_path).name == "after"
+
+
 def test_extract_from_requirements(tmp_path):
     """Testa extração de requirements.txt"""
     req_content = """
@@ -49,8 +145,7 @@ pandas>=2.1.0
 # Comentário
 matplotlib==3.8.0
     """
-    req_path = tmp_path / "requirements.txt"
-    req_path.write_text(req_content)
+    _setup_project(tmp_path, requirements=req_content)
 
     extractor = ProjectMetadataExtractor()
     deps = extractor.extract_from_requirements(tmp_path)
@@ -61,75 +156,99 @@ matplotlib==3.8.0
     assert len(deps) == 3
 
 
-def test_detect_mcp_from_keywords(tmp_path):
-    """Testa detecção de MCP a partir de keywords"""
-    # Criar pyproject.toml com keyword MCP
-    pyproject_content = """
-[project]
-name = "mcp-test"
-keywords = ["mcp", "Model Context Protocol"]
-dependencies = []
+def test_extract_from_requirements_pep508(tmp_path):
+    """Testa extras, markers, comentários inline, opções do pip e duplicatas no requirements.txt"""
+    req_content = """
+-r base.txt
+--index-url https://example.org/simple
+scikit-learn[alldeps]~=1.4  # comentário inline
+torch!=2.0.0; python_version >= "3.11"
+requests @ https://example.org/requests.tar.gz
+torch>=2.1; python_version < "3.11"
 """
-    (tmp_path / "pyproject.toml").write_text(pyproject_content)
+    _setup_project(tmp_path, requirements=req_content)
 
-    # Criar arquivo Python vazio
-    (tmp_path / "test.py").write_text("")
+    extractor = ProjectMetadataExtractor()
+    deps = extractor.extract_from_requirements(tmp_path)
 
-    assistant = AIResearchAssistant(tmp_path)
-    analysis = assistant.analyze_project()
+    assert deps == ["scikit-learn", "torch", "requests"]
 
-    assert "Model Context Protocol" in analysis.technologies
 
+def test_extract_from_empty_requirements(tmp_path):
+    """Testa requirements.txt vazio"""
+    _setup_project(tmp_path, requirements="")
 
-def test_detect_technologies_from_dependencies(tmp_path):
-    """Testa detecção a partir de dependências"""
-    pyproject_content = """
-[project]
-name = "test-deps"
-keywords = []
-dependencies = [
-    "numpy>=1.26.0",
-    "pydantic>=2.5.0",
-]
-"""
-    (tmp_path / "pyproject.toml").write_text(pyproject_content)
-    (tmp_path / "test.py").write_text("")
+    extractor = ProjectMetadataExtractor()
+    assert extractor.extract_from_requirements(tmp_path) == []
 
-    assistant = AIResearchAssistant(tmp_path)
-    analysis = assistant.analyze_project()
 
-    assert "NumPy" in analysis.technologies
-    assert "Pydantic" in analysis.technologies
+def test_extract_from_setup_py(tmp_path):
+    """Testa extração de metadados do setup.py"""
+    setup_content = """
+from setuptools import setup
+
+setup(
+    name="legacy-project",
+    long_description="Descrição longa",
+    description="A legacy project",
+    keywords=["mcp", "research",],
+)
+"""
+    _setup_project(tmp_path, setup_py=setup_content)
 
+    extractor = ProjectMetadataExtractor()
+    metadata = extractor.extract_from_setup_py(tmp_path)
 
-def test_detect_technologies_from_imports(tmp_path):
-    """Testa detecção a partir de imports no código"""
-    # Criar arquivo Python com imports
-    (tmp_path / "test.py").write_text("import numpy as np\nimport pandas as pd\n")
+    assert metadata is not None
+    assert metadata.name == "legacy-project"
+    assert metadata.description == "A legacy project"
+    assert metadata.keywords == ["mcp", "research"]
 
-    assistant = AIResearchAssistant(tmp_path)
-    analysis = assistant.analyze_project()
 
-    assert "NumPy" in analysis.technologies
-    assert "Pandas" in analysis.technologies
+def test_detect_mcp_from_keywords(mcp_assistant):
+    """Testa detecção de MCP a partir de keywords"""
+    analysis = mcp_assistant.analysis
 
+    assert "Model Context Protocol" in analysis.technologies
 
-def test_search_papers_with_mcp_keyword(tmp_path):
-    """Testa que MCP keyword resulta em papers sobre MCP"""
-    pyproject_content = """
-[project]
-name = "mcp-project"
-keywords = ["mcp"]
-dependencies = []
-"""
-    (tmp_path / "pyproject.toml").write_text(pyproject_content)
-    (tmp_path / "test.py").write_text("")
+
+@pytest.mark.parametrize(
+    ("technology", "source"),
+    [
+        ("NumPy", "dependencies"),
+        ("Pydantic", "dependencies"),
+        ("NumPy", "code imports"),
+        ("Pandas", "code imports"),
+    ],
+)
+def test_detect_technologies_from_dependencies_and_imports(numpy_assistant, technology, source):
+    """Testa detecção a partir de dependências e de imports no código (uma única análise)"""
+    assert source in numpy_assistant.analysis.detection_sources[technology]
+
+
+def test_detect_technologies_from_pep508_dependencies(tmp_path):
+    """Testa dependências com operadores, extras, markers e entradas inválidas"""
+    metadata = ProjectMetadata(
+        name="test-deps",
+        dependencies=[
+            "Scikit-Learn~=1.4",
+            "torch!=2.0.0; python_version >= '3.11'",
+            "fastapi[all]<1.0",
+            "não é uma dependência",
+        ],
+    )
 
     assistant = AIResearchAssistant(tmp_path)
-    assistant.analyze_project()
+    technologies, sources = assistant._detect_technologies(metadata, None, [])
+
+    assert technologies == ["FastAPI", "PyTorch", "Scikit-learn"]
+    assert all(s == ["dependencies"] for s in sources.values())
+
 
+def test_search_papers_with_mcp_keyword(mcp_assistant):
+    """Testa que MCP keyword resulta em papers sobre MCP"""
     # Buscar papers (deve usar keywords automaticamente)
-    papers = assistant.search_relevant_research()
+    papers = mcp_assistant.search_relevant_research()
 
     assert len(papers) > 0
     # Verificar que algum paper é sobre MCP
@@ -137,21 +256,9 @@ dependencies = []
     assert len(mcp_papers) > 0
 
 
-def test_metadata_in_analysis(tmp_path):
+def test_metadata_in_analysis(numpy_assistant):
     """Testa que metadados são incluídos na análise"""
-    pyproject_content = """
-[project]
-name = "meta-test"
-version = "2.0.0"
-description = "Test metadata"
-keywords = ["test"]
-dependencies = ["numpy>=1.0"]
-"""
-    (tmp_path / "pyproject.toml").write_text(pyproject_content)
-    (tmp_path / "test.py").write_text("")
-
-    assistant = AIResearchAssistant(tmp_path)
-    analysis = assistant.analyze_project()
+    analysis = numpy_assistant.analysis
 
     assert analysis.metadata is not None
     assert analysis.metadata.name == "meta-test"
@@ -160,20 +267,9 @@ dependencies = ["numpy>=1.0"]
     assert "test" in analysis.metadata.keywords
 
 
-def test_suggestions_for_mcp_project(tmp_path):
+def test_suggestions_for_mcp_project(mcp_assistant):
     """Testa sugestões específicas para projetos MCP"""
-    pyproject_content = """
-[project]
-name = "mcp-app"
-keywords = ["mcp"]
-dependencies = []
-"""
-    (tmp_path / "pyproject.toml").write_text(pyproject_content)
-    (tmp_path / "test.py").write_text("")
-
-    assistant = AIResearchAssistant(tmp_path)
-    assistant.analyze_project()
-    suggestions = assistant.suggest_improvements()
+    suggestions = mcp_assistant.suggest_improvements()
 
     # Deve ter sugestões específicas sobre MCP
     mcp_suggestions = [s for s in suggestions if "MCP" in s or "Model Context Protocol" in s]
@@ -183,8 +279,7 @@ dependencies = []
 def test_fallback_to_requirements(tmp_path):
     """Testa fallback para requirements.txt quando não há pyproject.toml"""
     # Sem pyproject.toml, apenas requirements.txt
-    (tmp_path / "requirements.txt").write_text("numpy>=1.0\npandas>=2.0\n")
-    (tmp_path / "test.py").write_text("")
+    _setup_project(tmp_path, requirements="numpy>=1.0\npandas>=2.0\n")
 
     assistant = AIResearchAssistant(tmp_path)
     analysis = assistant.analyze_project()
@@ -193,9 +288,21 @@ def test_fallback_to_requirements(tmp_path):
     assert len(analysis.metadata.dependencies) == 2
 
 
+def test_pyproject_without_project_table_falls_back(tmp_path):
+    """Testa que um pyproject.toml sem [project] não impede o fallback"""
+    _setup_project(
+        tmp_path, pyproject="[tool.ruff]\nline-length = 100\n", requirements="numpy>=1.0\n"
+    )
+
+    assistant = AIResearchAssistant(tmp_path)
+    analysis = assistant.analyze_project()
+
+    assert analysis.metadata.dependencies == ["numpy"]
+
+
 def test_no_metadata_files(tmp_path):
     """Testa comportamento quando não há arquivos de metadados"""
-    (tmp_path / "test.py").write_text("import numpy\n")
+    _setup_project(tmp_path, py_files={"test.py": "import numpy\n"})
 
     assistant = AIResearchAssistant(tmp_path)
     analysis = assistant.analyze_project()
@@ -2,95 +2,102 @@
 Testes para o ReadmeParser
 """
 
+import threading
+import warnings
+
+import pytest
+
 from ai_research_assistant.readme_parser import (
     ReadmeParser,
+    ResearchMetadata,
     create_research_readme_template,
+    render_research_readme_template,
 )
 
 
-def test_parse_research_focus(tmp_path):
-    """Testa parsing de Research Focus"""
-    readme_content = """
-# Test Project
-
-## Research Focus
-
-- Machine Learning
-- Deep Learning
-- Time Series Analysis
-"""
-    readme_path = tmp_path / "README.md"
-    readme_path.write_text(readme_content)
-
-    parser = ReadmeParser()
-    metadata = parser.parse(readme_path)
+@pytest.fixture(scope="module")
+def parser():
+    """Parser compartilhado pelo módulo: não guarda estado entre chamadas"""
+    return ReadmeParser()
 
-    assert metadata is not None
-    assert len(metadata.research_focus) == 3
-    assert "Machine Learning" in metadata.research_focus
-    assert "Deep Learning" in metadata.research_focus
-    assert "Time Series Analysis" in metadata.research_focus
 
+@pytest.fixture(scope="module")
+def shared_tmp(tmp_path_factory):
+    """Diretório único do módulo; cada teste usa nomes de arquivo distintos"""
+    return tmp_path_factory.mktemp("readme", numbered=False)
 
-def test_parse_research_questions(tmp_path):
-    """Testa parsing de Research Questions"""
-    readme_content = """
-## Research Questions
 
-- How can we improve accuracy?
-- Which model is best?
-"""
-    readme_path = tmp_path / "README.md"
-    readme_path.write_text(readme_content)
+# Variações de caixa e aliases de seções, num único README
+_ALIASED_README = """
+## research focus
+- ML
 
-    parser = ReadmeParser()
-    metadata = parser.parse(readme_path)
+## RESEARCH QUESTIONS
+- Question?
 
-    assert len(metadata.research_questions) == 2
-    assert any("accuracy" in q.lower() for q in metadata.research_questions)
+## Research Area
+- AI
 
+## Tech Stack
+- Python
 
-def test_parse_technologies(tmp_path):
-    """Testa parsing de Technologies"""
-    readme_content = """
-## Technologies
+## Key Questions
+- What?
 
-- Python 3.13
-- TensorFlow
-- PyTorch
-- LSTM
+## Objectives
+- Goal 1
 """
-    readme_path = tmp_path / "README.md"
-    readme_path.write_text(readme_content)
-
-    parser = ReadmeParser()
-    metadata = parser.parse(readme_path)
 
-    assert len(metadata.technologies) == 4
-    assert "Python 3.13" in metadata.technologies
-    assert "TensorFlow" in metadata.technologies
 
+@pytest.fixture(scope="module")
+def aliased_metadata(parser):
+    """Metadados de _ALIASED_README, parseados uma vez por módulo"""
+    return parser.parse_text(_ALIASED_README)
+
+
+@pytest.mark.parametrize(
+    "header,attr,items",
+    [
+        (
+            "Research Focus",
+            "research_focus",
+            ["Machine Learning", "Deep Learning", "Time Series Analysis"],
+        ),
+        (
+            "Research Questions",
+            "research_questions",
+            ["How can we improve accuracy?", "Which model is best?"],
+        ),
+        (
+            "Technologies",
+            "technologies",
+            ["Python 3.13", "TensorFlow", "PyTorch", "LSTM"],
+        ),
+        (
+            "Keywords",
+            "keywords",
+            ["machine learning", "deep learning", "anomaly detection"],
+        ),
+    ],
+)
+def test_parse_single_section(parser, header, attr, items):
+    """Testa parsing de cada seção isolada"""
+    bullets = "\n".join(f"- {item}" for item in items)
+    readme_content = f"""
+# Test Project
 
-def test_parse_keywords(tmp_path):
-    """Testa parsing de Keywords"""
-    readme_content = """
-## Keywords
+## {header}
 
-- machine learning
-- deep learning
-- anomaly detection
+{bullets}
 """
-    readme_path = tmp_path / "README.md"
-    readme_path.write_text(readme_content)
 
-    parser = ReadmeParser()
-    metadata = parser.parse(readme_path)
+    metadata = parser.parse_text(readme_content)
 
-    assert len(metadata.keywords) == 3
-    assert "machine learning" in metadata.keywords
+    assert metadata is not None
+    assert getattr(metadata, attr) == items
 
 
-def test_parse_all_sections(tmp_path):
+def test_parse_all_sections(parser, shared_tmp):
     """Testa parsing de todas as seções"""
     readme_content = """
 # Complete Project
@@ -119,10 +126,9 @@ def test_parse_all_sections(tmp_path):
 ## Datasets
 - Internal data
 """
-    readme_path = tmp_path / "README.md"
+    readme_path = shared_tmp / "all_sections.md"
     readme_path.write_text(readme_content)
 
-    parser = ReadmeParser()
     metadata = parser.parse(readme_path)
 
     assert len(metadata.research_focus) > 0
@@ -134,7 +140,7 @@ def test_parse_all_sections(tmp_path):
     assert len(metadata.datasets) > 0
 
 
-def test_extract_research_queries(tmp_path):
+def test_extract_research_queries(parser):
     """Testa geração de queries de pesquisa"""
     readme_content = """
 ## Research Focus
@@ -148,11 +154,8 @@ def test_extract_research_queries(tmp_path):
 - detection
 - ml
 """
-    readme_path = tmp_path / "README.md"
-    readme_path.write_text(readme_content)
 
-    parser = ReadmeParser()
-    metadata = parser.parse(readme_path)
+    metadata = parser.parse_text(readme_content)
     queries = parser.extract_research_queries(metadata)
 
     assert len(queries) > 0
@@ -162,27 +165,24 @@ def test_extract_research_queries(tmp_path):
     assert any("anomaly" in q.lower() for q in queries)
 
 
-def test_parse_nonexistent_file(tmp_path):
+def test_parse_nonexistent_file(parser, shared_tmp):
     """Testa comportamento com arquivo inexistente"""
-    parser = ReadmeParser()
-    metadata = parser.parse(tmp_path / "NONEXISTENT.md")
+
+    metadata = parser.parse(shared_tmp / "NONEXISTENT.md")
 
     assert metadata is None
 
 
-def test_parse_empty_readme(tmp_path):
+def test_parse_empty_readme(parser):
     """Testa parsing de README vazio"""
-    readme_path = tmp_path / "README.md"
-    readme_path.write_text("")
 
-    parser = ReadmeParser()
-    metadata = parser.parse(readme_path)
+    metadata = parser.parse_text("")
 
     assert metadata is not None
     assert len(metadata.research_focus) == 0
 
 
-def test_parse_with_markdown_formatting(tmp_path):
+def test_parse_with_markdown_formatting(parser):
     """Testa remoção de formatação Markdown"""
     readme_content = """
 ## Technologies
@@ -192,11 +192,8 @@ def test_parse_with_markdown_formatting(tmp_path):
 - `PyTorch`
 - [NumPy](https://numpy.org)
 """
-    readme_path = tmp_path / "README.md"
-    readme_path.write_text(readme_content)
 
-    parser = ReadmeParser()
-    metadata = parser.parse(readme_path)
+    metadata = parser.parse_text(readme_content)
 
     # Deve remover formatação mas manter texto
     assert any("Python" in tech for tech in metadata.technologies)
@@ -205,36 +202,18 @@ def test_parse_with_markdown_formatting(tmp_path):
     assert any("NumPy" in tech for tech in metadata.technologies)
 
 
-def test_case_insensitive_headers(tmp_path):
+def test_case_insensitive_headers(aliased_metadata):
     """Testa que headers são case-insensitive"""
-    readme_content = """
-## research focus
-- ML
-
-## RESEARCH QUESTIONS
-- Question?
-
-## Research Area
-- AI
-"""
-    readme_path = tmp_path / "README.md"
-    readme_path.write_text(readme_content)
-
-    parser = ReadmeParser()
-    metadata = parser.parse(readme_path)
-
     # Deve detectar todas variações
-    assert len(metadata.research_focus) >= 2  # ML e AI
+    assert aliased_metadata.research_focus == ["ML", "AI"]
+    assert "Question?" in aliased_metadata.research_questions
 
 
-def test_create_template(tmp_path):
-    """Testa criação de template"""
-    output_path = tmp_path / "TEMPLATE.md"
+def test_render_template():
+    """Testa o texto do template, sem passar pelo disco"""
+    content = render_research_readme_template("Test Project")
 
-    create_research_readme_template(output_path, "Test Project")
-
-    assert output_path.exists()
-    content = output_path.read_text()
+    assert content.startswith("# Test Project\n")
 
     # Deve conter seções principais
     assert "## Research Focus" in content
@@ -243,7 +222,18 @@ def test_create_template(tmp_path):
     assert "## Keywords" in content
 
 
-def test_numbered_lists(tmp_path):
+def test_create_template(shared_tmp):
+    """Testa criação do template em disco"""
+    output_path = shared_tmp / "TEMPLATE.md"
+
+    create_research_readme_template(output_path, "Test Project")
+
+    assert output_path.read_text(encoding="utf-8") == render_research_readme_template(
+        "Test Project"
+    )
+
+
+def test_numbered_lists(parser):
     """Testa parsing de listas numeradas"""
     readme_content = """
 ## Methodology
@@ -252,17 +242,14 @@ def test_numbered_lists(tmp_path):
 2. Model training
 3. Evaluation
 """
-    readme_path = tmp_path / "README.md"
-    readme_path.write_text(readme_content)
 
-    parser = ReadmeParser()
-    metadata = parser.parse(readme_path)
+    metadata = parser.parse_text(readme_content)
 
     assert len(metadata.methodology) == 3
     assert "Data preprocessing" in metadata.methodology
 
 
-def test_mixed_list_styles(tmp_path):
+def test_mixed_list_styles(parser):
     """Testa diferentes estilos de lista"""
     readme_content = """
 ## Keywords
@@ -271,16 +258,13 @@ def test_mixed_list_styles(tmp_path):
 * keyword2
 + keyword3
 """
-    readme_path = tmp_path / "README.md"
-    readme_path.write_text(readme_content)
 
-    parser = ReadmeParser()
-    metadata = parser.parse(readme_path)
+    metadata = parser.parse_text(readme_content)
 
     assert len(metadata.keywords) == 3
 
 
-def test_query_generation_priority(tmp_path):
+def test_query_generation_priority(parser):
     """Testa prioridade na geração de queries"""
     readme_content = """
 ## Research Focus
@@ -297,11 +281,8 @@ def test_query_generation_priority(tmp_path):
 ## Research Questions
 - Question A?
 """
-    readme_path = tmp_path / "README.md"
-    readme_path.write_text(readme_content)
 
-    parser = ReadmeParser()
-    metadata = parser.parse(readme_path)
+    metadata = parser.parse_text(readme_content)
     queries = parser.extract_research_queries(metadata)
 
     # Deve incluir research focus (prioridade alta)
@@ -311,29 +292,109 @@ def test_query_generation_priority(tmp_path):
     assert any("key1" in q or "key2" in q for q in queries)
 
 
-def test_section_aliases(tmp_path):
+def test_section_aliases(aliased_metadata):
     """Testa aliases de seções"""
-    readme_content = """
-## Tech Stack
-- Python
-
-## Key Questions
-- What?
-
-## Objectives
-- Goal 1
-"""
-    readme_path = tmp_path / "README.md"
-    readme_path.write_text(readme_content)
-
-    parser = ReadmeParser()
-    metadata = parser.parse(readme_path)
-
     # Tech Stack -> Technologies
-    assert len(metadata.technologies) > 0
+    assert aliased_metadata.technologies == ["Python"]
 
     # Key Questions -> Research Questions
-    assert len(metadata.research_questions) > 0
+    assert "What?" in aliased_metadata.research_questions
 
     # Objectives -> Goals
-    assert len(metadata.goals) > 0
+    assert aliased_metadata.goals == ["Goal 1"]
+
+
+def test_parse_uses_content_cache(tmp_path, monkeypatch):
+    """Testa cache em disco do README, com chave pelo conteúdo"""
+    monkeypatch.setattr(ReadmeParser, "cache_stats", type(ReadmeParser.cache_stats)())
+    readme_path = tmp_path / "README.md"
+    readme_path.write_text("## Research Focus\n- Machine Learning\n")
+    cache_dir = tmp_path / "cache"
+
+    first = ReadmeParser.parse(readme_path, cache_dir=cache_dir)
+    second = ReadmeParser.parse(readme_path, cache_dir=cache_dir)
+
+    assert first == second
+    assert ReadmeParser.cache_stats == {"misses": 1, "hits": 1}
+
+    # Conteúdo alterado gera nova chave
+    readme_path.write_text("## Research Focus\n- Deep Learning\n")
+    third = ReadmeParser.parse(readme_path, cache_dir=cache_dir)
+
+    assert third.research_focus == ["Deep Learning"]
+    assert ReadmeParser.cache_stats["misses"] == 2
+
+
+def test_section_mapping_priority():
+    """Testa que headers exatos e a ordem do mapeamento decidem o campo"""
+    readme_content = "## Data Sources\n- UCI\n\n## Research Questions and Data\n- Why?\n"
+
+    metadata = ReadmeParser.parse_text(readme_content)
+
+    assert metadata.datasets == ["UCI"]
+    assert metadata.research_questions == ["Why?"]
+
+
+def test_query_generation_order():
+    """Testa a ordem exata das queries e a combinação metodologia x focus"""
+    metadata = ResearchMetadata(
+        research_focus=["F1", "F2", "F3"],
+        research_questions=["Why?"],
+        keywords=["k1", "k2", "k3", "k4"],
+        methodology=["M1", "M2", "M3"],
+    )
+
+    assert ReadmeParser.extract_research_queries(metadata) == [
+        "F1",
+        "F2",
+        "F3",
+        "Why",
+        "k1 k2 k3",
+        "M1 F1",
+        "M1 F2",
+        "M2 F1",
+        "M2 F2",
+    ]
+
+
+def test_parse_many(tmp_path):
+    """Testa parsing de vários READMEs em processos, na ordem de entrada"""
+    paths = []
+    for i in range(3):
+        (tmp_path / f"sub{i}").mkdir()
+        path = tmp_path / f"sub{i}" / "README.md"
+        path.write_text(f"## Keywords\n- keyword {i}\n")
+        paths.append(path)
+    paths.append(tmp_path / "missing" / "README.md")
+
+    results = ReadmeParser.parse_many(paths, workers=2)
+
+    assert list(results) == paths
+    assert [m.keywords for m in list(results.values())[:3]] == [
+        ["keyword 0"],
+        ["keyword 1"],
+        ["keyword 2"],
+    ]
+    assert results[paths[3]] is None
+    assert ReadmeParser.parse_many([]) == {}
+
+
+def test_parse_many_does_not_fork_threaded_process(tmp_path):
+    """Testa que parse_many não faz fork() de um processo com threads ativas"""
+    path = tmp_path / "README.md"
+    path.write_text("## Keywords\n- threads\n")
+
+    release = threading.Event()
+    background = threading.Thread(target=release.wait)
+    background.start()
+    try:
+        with warnings.catch_warnings(record=True) as caught:
+            # O Python avisa (DeprecationWarning) ao fazer fork() com várias threads
+            warnings.simplefilter("always")
+            results = ReadmeParser.parse_many([path, path], workers=2)
+    finally:
+        release.set()
+        background.join()
+
+    assert not [w for w in caught if "fork()" in str(w.message)]
+    assert [m.keywords for m in results.values()] == [["threads"]]